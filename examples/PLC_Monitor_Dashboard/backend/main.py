@@ -6,27 +6,43 @@ Real-time PLC monitoring using rust-ethernet-ip library
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
+import orjson
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 # Import our Rust library
-from rust_ethernet_ip import PyEipClient, PyPlcValue, PySubscriptionOptions
+from rust_ethernet_ip import PyEipClient, PyPlcValue
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Use uvloop wherever an event loop gets created (uvicorn, TestClient, scripts)
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Global variables for PLC connection and WebSocket connections
 plc_client: Optional[PyEipClient] = None
 active_connections: List[WebSocket] = []
 tag_subscriptions: Dict[str, Any] = {}
+# Guards tag_subscriptions against changes while the monitor task takes its
+# snapshot of due tags. Never held across PLC I/O.
+sub_lock = asyncio.Lock()
 
 # Pydantic models
 class PLCConnection(BaseModel):
@@ -61,17 +77,34 @@ class PLCStatus(BaseModel):
 
 # WebSocket connection manager
 class ConnectionManager:
+    # Per-client send timeout in seconds; a client slower than this is dropped
+    SEND_TIMEOUT = 1.0
+    # Outbound messages buffered per client before it is treated as too slow
+    QUEUE_SIZE = 32
+    # Clients handled per slice of a broadcast before yielding to the event loop
+    BROADCAST_SLICE = 50
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        # Each client gets its own bounded queue drained by a relay task, so a
+        # slow client only ever backs up its own queue, never the broadcaster.
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._relays: Dict[WebSocket, asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        self._queues[websocket] = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._relays[websocket] = asyncio.create_task(self._relay(websocket))
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        relay = self._relays.pop(websocket, None)
+        if relay is not None and relay is not asyncio.current_task():
+            relay.cancel()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
@@ -81,61 +114,247 @@ class ConnectionManager:
             logger.error(f"Error sending message: {e}")
             self.disconnect(websocket)
 
-    async def broadcast(self, message: str):
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting message: {e}")
-                disconnected.append(connection)
-        
-        # Remove disconnected connections
-        for connection in disconnected:
-            self.disconnect(connection)
+    async def _relay(self, websocket: WebSocket):
+        """Drain one client's outbound queue onto its socket"""
+        queue = self._queues[websocket]
+        try:
+            while True:
+                payload = await queue.get()
+                await asyncio.wait_for(websocket.send_bytes(payload), timeout=self.SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error broadcasting message: {e}")
+            self.disconnect(websocket)
+
+    def _mark_slow(self, websocket: WebSocket):
+        """Drop a client whose outbound queue is full and close its socket"""
+        logger.warning("Dropping slow WebSocket client: outbound queue full")
+        self.disconnect(websocket)
+        task = asyncio.create_task(self._close_quietly(websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_quietly(self, websocket: WebSocket):
+        try:
+            await asyncio.wait_for(websocket.close(code=1013), timeout=self.SEND_TIMEOUT)
+        except Exception:
+            pass
+
+    async def broadcast(self, payload: bytes):
+        """Queue an already-encoded payload for every client.
+
+        The payload is encoded once by the caller and the same buffer is
+        queued for every connection; relay tasks send it as a binary frame.
+        Queueing never blocks, so broadcast cost does not depend on how fast
+        any client reads. Large audiences are handled in slices with a yield
+        between them, letting relay tasks start sending and keeping the event
+        loop responsive while the rest are queued.
+        """
+        connections = list(self.active_connections)
+        for start in range(0, len(connections), self.BROADCAST_SLICE):
+            if start:
+                await asyncio.sleep(0)
+            for connection in connections[start:start + self.BROADCAST_SLICE]:
+                queue = self._queues.get(connection)
+                if queue is None:
+                    continue
+                try:
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    self._mark_slow(connection)
 
 manager = ConnectionManager()
 
+# Tags per read_tags_batch call; matches the Rust BatchConfig default of
+# 20 operations per Multiple Service Packet so each call stays within the
+# conservative 504-byte CIP packet limit.
+BATCH_CHUNK_SIZE = 20
+
+# Bounds on the monitor loop sleep between scans, in seconds. The loop wakes
+# when the next subscription is due, but never spins faster than the minimum
+# and never sleeps past the maximum so new subscriptions are picked up quickly.
+MIN_SCAN_INTERVAL = 0.05
+MAX_SCAN_INTERVAL = 0.5
+
+# Minimum seconds between read-error log records for the same tag; a tag that
+# keeps failing is reported once per interval with a count of the failures.
+ERROR_LOG_INTERVAL = 5.0
+
+# Broadcasts carrying more tag values than this are JSON-encoded on the default
+# executor instead of the event loop thread. The dedicated PLC executor is not
+# used: its single worker is reserved for ordered PLC session traffic.
+OFFLOAD_ENCODE_THRESHOLD = 64
+
+# PLC data type names reported for the Python types PyPlcValue.value returns.
+# These match the data_type values accepted by /tags/write.
+_TYPE_NAME = {int: "dint", float: "real", bool: "bool", str: "string"}
+
+def data_type_name(value: Any) -> str:
+    """Name the PLC data type of a value read from the PLC"""
+    value_type = type(value)
+    return _TYPE_NAME.get(value_type, value_type.__name__)
+
+# Text accepted for BOOL writes; the dashboard sends edited values as strings
+_BOOL_TEXT = {"true": True, "1": True, "false": False, "0": False}
+
+def parse_bool(value: Any) -> bool:
+    """Parse a BOOL write value: a JSON boolean or "true"/"false"/"1"/"0" in any case"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in _BOOL_TEXT:
+        return _BOOL_TEXT[value.strip().lower()]
+    raise ValueError(f"Invalid BOOL value: {value!r}")
+
+def chunk_tag_names(names: List[str], size: int = BATCH_CHUNK_SIZE) -> List[List[str]]:
+    """Split tag names into groups that fit in one CIP Multiple Service Packet"""
+    return [names[i:i + size] for i in range(0, len(names), size)]
+
+async def run_plc(func, *args):
+    """Run a blocking PLC call on the dedicated PLC executor.
+
+    The PyO3 client methods block for a full network round-trip, so they
+    must not run on the event loop thread. The executor has a single worker
+    to keep requests on the EtherNet/IP session strictly ordered.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(app.state.plc_exec, func, *args)
+
+def value_changed(subscription: Dict[str, Any], data_type: str, value: Any) -> bool:
+    """Check whether a read differs enough from the last broadcast to publish.
+
+    Numeric values must move by at least the subscription's change_threshold;
+    other values publish on any inequality. A change of data_type, which
+    includes the first read and recovery from an error, always publishes.
+    """
+    if subscription["last_data_type"] != data_type:
+        return True
+    last_value = subscription["last_value"]
+    if (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        and isinstance(last_value, (int, float)) and not isinstance(last_value, bool)
+    ):
+        return abs(value - last_value) >= subscription["change_threshold"]
+    return value != last_value
+
+def reset_last_values():
+    """Forget the last broadcast values so every tag is published on its next read"""
+    for subscription in tag_subscriptions.values():
+        subscription["last_value"] = None
+        subscription["last_data_type"] = None
+
+def log_read_error(error_log: Dict[str, List[float]], tag_name: str, error: Exception, now: float):
+    """Log a tag read error, at most once per ERROR_LOG_INTERVAL for each tag"""
+    entry = error_log[tag_name]
+    entry[0] += 1
+    if now - entry[1] > ERROR_LOG_INTERVAL:
+        logger.error("Error reading tag %s: %s (%d failures since last report)", tag_name, error, entry[0])
+        entry[0] = 0
+        entry[1] = now
+
 # Background task for PLC monitoring
 async def plc_monitor_task():
     """Background task to monitor PLC tags and broadcast updates"""
     global plc_client, tag_subscriptions
+
+    # tag name -> [failures since last report, time of last report]
+    error_log: Dict[str, List[float]] = defaultdict(lambda: [0, float("-inf")])
+    log_errors = logger.isEnabledFor(logging.ERROR)
+
+    # Bind hot-loop names to locals once: local lookups are cheaper than
+    # module globals and builtins on every tag of every scan.
+    subs = tag_subscriptions
+    broadcast = manager.broadcast
+    monotonic = time.monotonic
+    now_dt = datetime.now
+    type_name = data_type_name
+    changed = value_changed
+    loop = asyncio.get_running_loop()
     
     while True:
         try:
-            if plc_client and tag_subscriptions:
-                # Read all subscribed tags
-                for tag_name, subscription in tag_subscriptions.items():
+            delay = MAX_SCAN_INTERVAL
+            client = plc_client
+            if client and subs:
+                read_batch = client.read_tags_batch
+                # Snapshot the tags whose update_rate says they are due. Results
+                # are matched back by name, so tags unsubscribed while the
+                # batch is in flight are simply skipped.
+                async with sub_lock:
+                    now = monotonic()
+                    # One timestamp for every value read in this scan
+                    timestamp = now_dt()
+                    names = [
+                        tag_name for tag_name, subscription in subs.items()
+                        if now >= subscription["next_due"]
+                    ]
+                    for tag_name in names:
+                        subscription = subs[tag_name]
+                        subscription["next_due"] = now + subscription["update_rate"] / 1000
+
+                # Plain dicts rather than TagValue models: the schema is fixed, so
+                # pydantic validation per tag per tick buys nothing here. TagValue
+                # stays the response model for the HTTP endpoints.
+                tag_values: List[Dict[str, Any]] = []
+                # Read due tags with one batched request per chunk
+                for chunk in chunk_tag_names(names):
                     try:
-                        # Read tag value
-                        value = plc_client.read_tag(tag_name)
-                        
-                        # Create tag value object
-                        tag_value = TagValue(
-                            tag_name=tag_name,
-                            value=value.value,
-                            data_type=type(value.value).__name__,
-                            timestamp=datetime.now(),
-                            quality="good"
-                        )
-                        
-                        # Broadcast to all connected clients
-                        await manager.broadcast(tag_value.model_dump_json())
-                        
+                        results = await run_plc(read_batch, chunk)
                     except Exception as e:
-                        logger.error(f"Error reading tag {tag_name}: {e}")
-                        # Send error status
-                        error_value = TagValue(
-                            tag_name=tag_name,
-                            value=None,
-                            data_type="error",
-                            timestamp=datetime.now(),
-                            quality="bad"
-                        )
-                        await manager.broadcast(error_value.model_dump_json())
+                        # Reported per tag below, subject to rate limiting
+                        results = [e] * len(chunk)
+
+                    # One result per tag, in chunk order
+                    for tag_name, value in zip(chunk, results):
+                        if isinstance(value, Exception):
+                            if log_errors:
+                                log_read_error(error_log, tag_name, value, now)
+                            # Send error status
+                            tag_value = {
+                                "tag_name": tag_name,
+                                "value": None,
+                                "data_type": "error",
+                                "timestamp": timestamp,
+                                "quality": "bad",
+                            }
+                        else:
+                            plc_value = value.value
+                            tag_value = {
+                                "tag_name": tag_name,
+                                "value": plc_value,
+                                "data_type": type_name(plc_value),
+                                "timestamp": timestamp,
+                                "quality": "good",
+                            }
+
+                        # Only publish values that moved past the change threshold
+                        subscription = subs.get(tag_name)
+                        if subscription is None or not changed(
+                            subscription, tag_value["data_type"], tag_value["value"]
+                        ):
+                            continue
+                        subscription["last_value"] = tag_value["value"]
+                        subscription["last_data_type"] = tag_value["data_type"]
+                        tag_values.append(tag_value)
+
+                # Broadcast the whole poll cycle to all connected clients as one message
+                if tag_values:
+                    # orjson serializes datetime natively in the same ISO format
+                    # pydantic used; timestamps stay naive local time.
+                    batch = {"ts": timestamp, "tags": tag_values}
+                    if len(tag_values) > OFFLOAD_ENCODE_THRESHOLD:
+                        payload = await loop.run_in_executor(None, orjson.dumps, batch)
+                    else:
+                        payload = orjson.dumps(batch)
+                    await broadcast(payload)
+
+                # Sleep until the earliest subscription is due again
+                if subs:
+                    next_due = min(sub["next_due"] for sub in subs.values())
+                    delay = min(max(next_due - monotonic(), MIN_SCAN_INTERVAL), MAX_SCAN_INTERVAL)
             
             # Wait before next update
-            await asyncio.sleep(0.5)  # 500ms update rate
+            await asyncio.sleep(delay)
             
         except Exception as e:
             logger.error(f"Error in PLC monitor task: {e}")
@@ -146,6 +365,7 @@ async def plc_monitor_task():
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting PLC Monitor Dashboard Backend")
+    app.state.plc_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plc")
     # Start background monitoring task
     monitor_task = asyncio.create_task(plc_monitor_task())
     yield
@@ -156,6 +376,7 @@ async def lifespan(app: FastAPI):
         await monitor_task
     except asyncio.CancelledError:
         pass
+    app.state.plc_exec.shutdown(wait=True)
 
 app = FastAPI(
     title="PLC Monitor Dashboard API",
@@ -190,7 +411,15 @@ async def connect_to_plc(connection: PLCConnection):
     
     try:
         # Create new PLC client
-        plc_client = PyEipClient(connection.address)
+        new_client = await run_plc(PyEipClient, connection.address)
+        previous, plc_client = plc_client, new_client
+
+        # End the session being replaced instead of leaving it open on the PLC
+        if previous is not None:
+            try:
+                await run_plc(previous.unregister_session)
+            except Exception as e:
+                logger.warning(f"Error unregistering previous PLC session: {e}")
         
         # Test connection by reading a simple tag (this will fail if not connected)
         # For now, we'll assume connection is successful
@@ -212,11 +441,12 @@ async def disconnect_from_plc():
     
     try:
         if plc_client:
-            plc_client.unregister_session()
+            await run_plc(plc_client.unregister_session)
             plc_client = None
         
         # Clear subscriptions
-        tag_subscriptions.clear()
+        async with sub_lock:
+            tag_subscriptions.clear()
         
         logger.info("Disconnected from PLC")
         return {"status": "disconnected", "timestamp": datetime.now()}
@@ -245,12 +475,13 @@ async def read_tag(request: TagReadRequest):
         raise HTTPException(status_code=400, detail="Not connected to PLC")
     
     try:
-        value = plc_client.read_tag(request.tag_name)
+        value = await run_plc(plc_client.read_tag, request.tag_name)
+        plc_value = value.value
         
         return TagValue(
             tag_name=request.tag_name,
-            value=value.value,
-            data_type=type(value.value).__name__,
+            value=plc_value,
+            data_type=data_type_name(plc_value),
             timestamp=datetime.now(),
             quality="good"
         )
@@ -273,20 +504,25 @@ async def write_tag(request: TagWriteRequest):
         elif request.data_type == "real":
             plc_value = PyPlcValue.real(float(request.value))
         elif request.data_type == "bool":
-            plc_value = PyPlcValue(request.value)
+            try:
+                plc_value = PyPlcValue.bool_(parse_bool(request.value))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
         elif request.data_type == "string":
             plc_value = PyPlcValue.string(str(request.value))
         else:
             raise ValueError(f"Unsupported data type: {request.data_type}")
         
         # Write the value
-        success = plc_client.write_tag(request.tag_name, plc_value)
+        success = await run_plc(plc_client.write_tag, request.tag_name, plc_value)
         
         if success:
             return {"status": "success", "message": f"Tag {request.tag_name} written successfully"}
         else:
             raise HTTPException(status_code=500, detail="Failed to write tag")
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error writing tag {request.tag_name}: {e}")
         raise HTTPException(status_code=500, detail=f"Error writing tag: {str(e)}")
@@ -300,22 +536,20 @@ async def subscribe_to_tag(request: TagSubscriptionRequest):
         raise HTTPException(status_code=400, detail="Not connected to PLC")
     
     try:
-        # Create subscription options
-        options = PySubscriptionOptions(
-            update_rate=request.update_rate,
-            change_threshold=request.change_threshold,
-            timeout=5000
-        )
-        
-        # Subscribe to tag
-        plc_client.subscribe_to_tag(request.tag_name, options)
-        
-        # Add to our subscription tracking
-        tag_subscriptions[request.tag_name] = {
-            "update_rate": request.update_rate,
-            "change_threshold": request.change_threshold,
-            "subscribed_at": datetime.now()
-        }
+        # Only tracked here: the monitor task polls every subscription in
+        # batched reads when it falls due. A library-side subscription would
+        # add its own per-tag read loop that nothing consumes.
+        async with sub_lock:
+            tag_subscriptions[request.tag_name] = {
+                "update_rate": request.update_rate,
+                "change_threshold": request.change_threshold,
+                "subscribed_at": datetime.now(),
+                # Due immediately so the first value arrives on the next scan
+                "next_due": time.monotonic(),
+                # Last broadcast value, used for change_threshold filtering
+                "last_value": None,
+                "last_data_type": None
+            }
         
         logger.info(f"Subscribed to tag: {request.tag_name}")
         return {"status": "subscribed", "tag_name": request.tag_name}
@@ -329,8 +563,10 @@ async def unsubscribe_from_tag(tag_name: str):
     """Unsubscribe from a tag"""
     global tag_subscriptions
     
-    if tag_name in tag_subscriptions:
-        del tag_subscriptions[tag_name]
+    async with sub_lock:
+        removed = tag_subscriptions.pop(tag_name, None)
+    
+    if removed is not None:
         logger.info(f"Unsubscribed from tag: {tag_name}")
         return {"status": "unsubscribed", "tag_name": tag_name}
     else:
@@ -339,18 +575,36 @@ async def unsubscribe_from_tag(tag_name: str):
 @app.get("/tags/subscriptions")
 async def get_subscriptions():
     """Get all active tag subscriptions"""
-    return {"subscriptions": tag_subscriptions}
+    # Only the fields clients configured; next_due and last_value are
+    # scheduler state for the monitor task
+    return {
+        "subscriptions": {
+            tag_name: {
+                "update_rate": subscription["update_rate"],
+                "change_threshold": subscription["change_threshold"],
+                "subscribed_at": subscription["subscribed_at"],
+            }
+            for tag_name, subscription in tag_subscriptions.items()
+        }
+    }
+
+# Reply to application-level "ping" messages
+PONG = b"pong"
 
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
+    # Quiescent tags are only broadcast on change; republish everything once
+    # so the new client starts with a full set of values.
+    reset_last_values()
     try:
         while True:
-            # Keep connection alive
+            # Keepalive is handled by protocol-level ping/pong frames (see
+            # ws_ping_interval); only an explicit application "ping" is answered.
             data = await websocket.receive_text()
-            # Echo back for ping/pong
-            await websocket.send_text(f"Echo: {data}")
+            if data == "ping":
+                await websocket.send_bytes(PONG)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
@@ -360,5 +614,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http="httptools",
+        ws="websockets",
+        ws_ping_interval=20,
+        ws_ping_timeout=20
     )
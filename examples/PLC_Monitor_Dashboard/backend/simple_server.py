@@ -3,28 +3,11 @@
 Simple HTTP server to test if the basic setup works
 """
 
-import http.server
-import socketserver
-import json
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from datetime import datetime
 
-class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            response = {
-                'status': 'healthy',
-                'timestamp': datetime.now().isoformat(),
-                'message': 'Simple server is working!'
-            }
-            self.wfile.write(json.dumps(response).encode())
-        else:
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            html = """
+# Response bodies are built once; only the health timestamp changes per request
+HTML_BYTES = b"""
             <html>
             <head><title>PLC Monitor Dashboard - Simple Server</title></head>
             <body>
@@ -34,11 +17,25 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             </body>
             </html>
             """
-            self.wfile.write(html.encode())
+HEALTHY_TEMPLATE = b'{"status": "healthy", "timestamp": "%s", "message": "Simple server is working!"}'
+
+class MyHTTPRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/health':
+            response = HEALTHY_TEMPLATE % datetime.now().isoformat().encode()
+            content_type = 'application/json'
+        else:
+            response = HTML_BYTES
+            content_type = 'text/html'
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
 
 if __name__ == "__main__":
     PORT = 8000
-    with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+    with ThreadingHTTPServer(("", PORT), MyHTTPRequestHandler) as httpd:
         print(f"Server running at http://localhost:{PORT}")
         print("Press Ctrl+C to stop")
         try:
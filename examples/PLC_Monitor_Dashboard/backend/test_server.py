@@ -3,30 +3,127 @@
 Simple test script to verify the FastAPI server works
 """
 
+import asyncio
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
+class FakeWebSocket:
+    """Stands in for a client WebSocket; sends block until released"""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.sent = []
+        self.close_code = None
+
+    async def accept(self):
+        pass
+
+    async def send_bytes(self, payload):
+        await self.release.wait()
+        self.sent.append(payload)
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+async def check_connection_manager():
+    from main import ConnectionManager
+
+    # A client that stops reading is dropped once its queue is full
+    manager = ConnectionManager()
+    slow = FakeWebSocket()
+    await manager.connect(slow)
+    await asyncio.sleep(0)  # relay takes the first payload and blocks on it
+    for _ in range(manager.QUEUE_SIZE + 2):
+        await manager.broadcast(b"{}")
+    assert slow not in manager.active_connections
+    await asyncio.sleep(0.01)  # let the background close run
+    assert slow.close_code == 1013
+    print("✅ Slow client dropped when its queue is full")
+
+    # Disconnecting cancels the client's relay task
+    client = FakeWebSocket()
+    await manager.connect(client)
+    relay = manager._relays[client]
+    manager.disconnect(client)
+    await asyncio.sleep(0)
+    assert relay.cancelled()
+    print("✅ Relay task cancelled on disconnect")
+
+def check_value_changed():
+    from main import value_changed
+
+    subscription = {"change_threshold": 0.5, "last_value": None, "last_data_type": None}
+    assert value_changed(subscription, "dint", 10)  # first read
+
+    subscription.update(last_value=10, last_data_type="dint")
+    assert not value_changed(subscription, "dint", 10)
+    assert not value_changed(subscription, "dint", 10.4)
+    assert value_changed(subscription, "dint", 10.5)
+
+    # BOOL values ignore the threshold and publish on any change
+    subscription.update(change_threshold=5, last_value=False, last_data_type="bool")
+    assert not value_changed(subscription, "bool", False)
+    assert value_changed(subscription, "bool", True)
+
+    # A good read after an error publishes even if the value is unchanged
+    subscription.update(change_threshold=0.5, last_value=None, last_data_type="error")
+    assert not value_changed(subscription, "error", None)
+    assert value_changed(subscription, "dint", 10)
+    print("✅ value_changed threshold, BOOL and error-recovery decisions")
+
+def check_parse_bool():
+    from main import parse_bool
+
+    for text, expected in [("true", True), ("TRUE", True), ("1", True), (True, True),
+                           ("false", False), ("False", False), ("0", False), (False, False)]:
+        assert parse_bool(text) is expected, text
+    for invalid in ["maybe", "", 1, None]:
+        try:
+            parse_bool(invalid)
+        except ValueError:
+            continue
+        raise AssertionError(f"parse_bool accepted {invalid!r}")
+    print("✅ BOOL write values parsed explicitly")
+
+async def main():
+    import main as backend
     from main import app
     print("✅ FastAPI app imported successfully")
-    
-    # Test if we can create a client
-    from fastapi.testclient import TestClient
-    client = TestClient(app)
-    
-    # Test health endpoint
-    response = client.get("/health")
-    print(f"✅ Health endpoint test: {response.status_code}")
-    print(f"   Response: {response.json()}")
-    
-    # Test root endpoint
-    response = client.get("/")
-    print(f"✅ Root endpoint test: {response.status_code}")
-    print(f"   Response: {response.json()}")
-    
+
+    await check_connection_manager()
+    check_value_changed()
+    check_parse_bool()
+
+    # Call the app in-process on this event loop; no server thread or network
+    import httpx
+    from httpx import ASGITransport
+    async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # Test health endpoint
+        response = await client.get("/health")
+        print(f"✅ Health endpoint test: {response.status_code}")
+        print(f"   Response: {response.json()}")
+
+        # Test root endpoint
+        response = await client.get("/")
+        print(f"✅ Root endpoint test: {response.status_code}")
+        print(f"   Response: {response.json()}")
+
+        # An unparseable BOOL is rejected before anything is written
+        backend.plc_client = object()
+        try:
+            response = await client.post(
+                "/tags/write", json={"tag_name": "Flag", "value": "maybe", "data_type": "bool"}
+            )
+        finally:
+            backend.plc_client = None
+        assert response.status_code == 400, response.status_code
+        print(f"✅ Invalid BOOL write rejected: {response.status_code}")
+
     print("\n🎉 All tests passed! The backend is working correctly.")
-    
+
+try:
+    asyncio.run(main())
 except Exception as e:
     print(f"❌ Error: {e}")
     import traceback
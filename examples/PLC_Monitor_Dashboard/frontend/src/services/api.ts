@@ -9,7 +9,8 @@ import {
   TagSubscriptionRequest,
   PLCStatus,
   SubscriptionsResponse,
-  ApiResponse
+  ApiResponse,
+  TagBatch
 } from '../types';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
@@ -123,6 +124,7 @@ export class WebSocketService {
   private maxReconnectAttempts = 5;
   private reconnectInterval = 1000;
   private listeners: Map<string, ((data: any) => void)[]> = new Map();
+  private decoder = new TextDecoder();
 
   constructor(private url: string) {}
 
@@ -131,6 +133,7 @@ export class WebSocketService {
       try {
         const wsUrl = this.url.replace('http', 'ws');
         this.ws = new WebSocket(`${wsUrl}/ws`);
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
           console.log('WebSocket connected');
@@ -140,8 +143,17 @@ export class WebSocketService {
 
         this.ws.onmessage = (event) => {
           try {
-            const data = JSON.parse(event.data);
-            this.notifyListeners('message', data);
+            // Tag batches arrive as binary frames of UTF-8 JSON
+            const text = event.data instanceof ArrayBuffer
+              ? this.decoder.decode(event.data)
+              : event.data;
+            const data = JSON.parse(text);
+            if (Array.isArray(data.tags)) {
+              // The backend sends one TagBatch per poll cycle
+              (data as TagBatch).tags.forEach(tag => this.notifyListeners('message', tag));
+            } else {
+              this.notifyListeners('message', data);
+            }
           } catch (error) {
             console.error('Error parsing WebSocket message:', error);
           }
@@ -13,6 +13,12 @@ export interface TagValue {
   quality: 'good' | 'bad';
 }
 
+// WebSocket message carrying every tag value from one poll cycle
+export interface TagBatch {
+  ts: string;
+  tags: TagValue[];
+}
+
 export interface TagReadRequest {
   tag_name: string;
 }
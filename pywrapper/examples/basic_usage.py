@@ -40,14 +40,15 @@ def main():
         print(f"Write result: {result}")
         
         # Batch read multiple tags
-        results = client.read_tags_batch([
+        tag_names = [
             "MyIntTag",
             "MyRealTag",
             "MyStringTag"
-        ])
+        ]
+        results = client.read_tags_batch(tag_names)
         
         print("\nBatch read results:")
-        for tag_name, result in results:
+        for tag_name, result in zip(tag_names, results):
             if isinstance(result, Exception):
                 print(f"Error reading {tag_name}: {result}")
             else:
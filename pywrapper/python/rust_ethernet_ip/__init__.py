@@ -3,7 +3,9 @@ Python wrapper for the rust-ethernet-ip library.
 """
 
 from .rust_ethernet_ip import (
+    PyBatchReadResult,
     PyEipClient,
+    PyPlcArray,
     PyPlcValue,
     PySubscriptionOptions,
 )
@@ -11,7 +13,38 @@ from .rust_ethernet_ip import (
 __version__ = "0.5.3"
 
 __all__ = [
+    "EipClient",
+    "install_uvloop",
+    "PyBatchReadResult",
     "PyEipClient",
+    "PyPlcArray",
     "PyPlcValue",
     "PySubscriptionOptions",
-] 
\ No newline at end of file
+]
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the asyncio event loop, if it is installed.
+
+    Call once at startup, before the loop is created (i.e. before
+    ``asyncio.run``). Returns True if uvloop was installed and False if it is
+    not available; the default loop keeps working in that case.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def __getattr__(name):
+    # EipClient pulls in asyncio and the client module; load them only when it
+    # is first used, so importing the value types stays cheap (PEP 562)
+    if name == "EipClient":
+        from .client import EipClient
+        return EipClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
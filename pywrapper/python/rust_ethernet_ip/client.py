@@ -1,63 +1,413 @@
+from __future__ import annotations
+
 import asyncio
-from typing import Any, List, Tuple, Optional, Union
+import functools
+from typing import TYPE_CHECKING
+
+# Annotations are not evaluated at runtime (PEP 563), so typing is only
+# needed by type checkers
+if TYPE_CHECKING:
+    from typing import Any, AsyncIterator, Awaitable, Callable, List, Tuple, Optional, Union
 
 # Import the Rust extension module (must be built with maturin or setuptools-rust)
 try:
     from .rust_ethernet_ip import (
+        PyBatchReadResult,
         PyEipClient,
+        PyPlcArray,
         PyPlcValue,
         PySubscriptionOptions,
     )
 except ImportError as e:
     raise ImportError("The Rust extension module 'rust_ethernet_ip' could not be imported. Build it with maturin or setuptools-rust.") from e
 
+# numpy is optional; without it read_tag_array returns a memoryview. False
+# until the first lookup.
+_np = False
+
+def _numpy():
+    """numpy if installed, else None. Imported on first use, since it is slow to load."""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np = numpy
+    return _np
+
+# Seconds between keep-alive NOPs on an otherwise idle connection
+DEFAULT_KEEPALIVE_INTERVAL = 30.0
+
+class _BatchCoalescer:
+    """
+    Merges single-tag requests issued close together into one batch call.
+
+    Each request is queued with a future. A drain task takes the first pending
+    request, waits up to max_delay for more to arrive (unless max_batch are
+    already queued), then sends up to max_batch of them in one batch call and
+    resolves each future from its position in the results. Per-tag Exception
+    results are raised from the matching request.
+    """
+    def __init__(self, dispatch: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch: int, max_delay: float):
+        self._dispatch = dispatch
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        if self._task is None or self._loop.is_closed():
+            # Bound to the loop of the first request; cached so the hot path
+            # does not look it up on every call. Rebound if that loop has been
+            # closed, e.g. when the client is reused under another asyncio.run()
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue()
+            self._task = self._loop.create_task(self._drain())
+        future = self._loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _drain(self) -> None:
+        queue = self._queue
+        pending: List[Any] = []
+        try:
+            while True:
+                pending = [await queue.get()]
+                if queue.qsize() < self._max_batch - 1:
+                    await asyncio.sleep(self._max_delay)
+                while len(pending) < self._max_batch and not queue.empty():
+                    pending.append(queue.get_nowait())
+
+                batch = asyncio.ensure_future(self._dispatch([item for item, _ in pending]))
+                batch.add_done_callback(functools.partial(_resolve_batch, pending))
+                pending = []
+                # Cancelling the drain task (close()) stops this wait but not
+                # the batch, which still completes and resolves its requests
+                await asyncio.wait([batch])
+        except asyncio.CancelledError:
+            # close() ran before these requests were sent
+            for _, future in pending:
+                future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Stop the drain task and cancel any requests not yet sent.
+
+        A batch already sent to the PLC is left to complete and resolve its
+        requests.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+def _resolve_batch(pending: List[Any], batch: asyncio.Future) -> None:
+    """Resolve each request's future from its position in a finished batch."""
+    if batch.cancelled():
+        for _, future in pending:
+            future.cancel()
+        return
+    error = batch.exception()
+    if error is not None:
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(error)
+        return
+    for (_, future), result in zip(pending, batch.result()):
+        if future.done():
+            continue
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
 class EipClient:
     """
     Async EtherNet/IP client for Allen-Bradley PLCs (Python wrapper for Rust).
+
+    Tag operations await the extension's native ``*_async`` methods, which run
+    on the Rust Tokio runtime with the GIL released. The only blocking call,
+    connecting, runs once on asyncio's default executor. Use the client as an
+    async context manager, or call close(), to stop its background tasks.
+
+    With ``coalesce=True``, read_tag and write_tag calls made at about the same
+    time (for example from ``asyncio.gather``) are merged into read_tags_batch
+    and write_tags_batch calls of up to ``max_batch`` tags. A request waits at
+    most ``max_delay_us`` microseconds for others to join it. The default of 20
+    tags per batch matches the extension's CIP Multiple Service Packet size.
+
+    read_tags_batch splits long tag lists into ``chunk_size`` tag chunks and
+    keeps up to ``max_inflight`` of them in flight at once.
+
+    Registering a session takes several round trips, so connect once and keep
+    the client for the life of the application; do not connect and
+    unregister around each scan. connect() starts a task that sends a
+    keep-alive NOP every ``keepalive_interval`` seconds (None disables it) so
+    an idle session is not timed out by the PLC. unregister_session ends the
+    session for good. Leaving an ``async with`` block unregisters and closes
+    the client.
     """
-    def __init__(self, inner: Any):
+    def __init__(self, inner: Any, coalesce: bool = False, max_batch: int = 20,
+                 max_delay_us: int = 200, chunk_size: int = 20, max_inflight: int = 8):
         self._inner = inner
+        self._chunk_size = chunk_size
+        self._max_inflight = max_inflight
+        # Created on first use so it belongs to the loop the client runs on
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # Event loop the client was connected on, set by connect()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._read_coalescer: Optional[_BatchCoalescer] = None
+        self._write_coalescer: Optional[_BatchCoalescer] = None
+        if coalesce:
+            max_delay = max_delay_us / 1_000_000
+            self._read_coalescer = _BatchCoalescer(self._inner.read_tags_batch_async, max_batch, max_delay)
+            self._write_coalescer = _BatchCoalescer(self._write_results, max_batch, max_delay)
 
     @classmethod
-    async def connect(cls, address: str) -> 'EipClient':
+    async def connect(cls, address: str, coalesce: bool = False, max_batch: int = 20,
+                      max_delay_us: int = 200, chunk_size: int = 20,
+                      max_inflight: int = 8,
+                      keepalive_interval: Optional[float] = DEFAULT_KEEPALIVE_INTERVAL) -> 'EipClient':
         loop = asyncio.get_running_loop()
-        inner = await loop.run_in_executor(None, lambda: PyEipClient(addr=address))
-        return cls(inner)
+        inner = await loop.run_in_executor(None, functools.partial(PyEipClient, addr=address))
+        client = cls(inner, coalesce=coalesce, max_batch=max_batch, max_delay_us=max_delay_us,
+                     chunk_size=chunk_size, max_inflight=max_inflight)
+        client._loop = loop
+        if keepalive_interval is not None:
+            client._keepalive_task = loop.create_task(client._keepalive(keepalive_interval))
+        return client
+
+    async def _keepalive(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._inner.send_keep_alive_async()
+            except Exception:
+                # A broken connection surfaces on the next tag operation;
+                # keep trying in case it was transient
+                pass
+
+    def _stop_keepalive(self) -> None:
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """The cached event loop, falling back to the running one if it is unset or closed."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    async def close(self) -> None:
+        """Stop the keep-alive task and the coalescers' drain tasks."""
+        self._stop_keepalive()
+        for coalescer in (self._read_coalescer, self._write_coalescer):
+            if coalescer is not None:
+                coalescer.close()
+
+    async def __aenter__(self) -> 'EipClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.unregister_session()
+        finally:
+            await self.close()
 
     async def read_tag(self, tag_name: str) -> PyPlcValue:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: self._inner.read_tag(tag_name))
+        if self._read_coalescer is not None:
+            return await self._read_coalescer.submit(tag_name)
+        return await self._inner.read_tag_async(tag_name)
 
-    async def write_tag(self, tag_name: str, value: PyPlcValue) -> None:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: self._inner.write_tag(tag_name, value))
+    async def write_tag(self, tag_name: str, value: PyPlcValue) -> bool:
+        """
+        Write one tag. Build ``value`` with the factory for the tag's PLC type,
+        e.g. ``PlcValue.dint(42)``, ``PlcValue.real(1.5)`` or ``PlcValue.bool_(True)``.
 
-    async def read_tags_batch(self, tag_names: List[str]) -> List[Tuple[str, Union[PyPlcValue, Exception]]]:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: self._inner.read_tags_batch(tag_names))
+        Returns True once the write succeeds, like write_tag_sync; a failed
+        write raises.
+        """
+        if self._write_coalescer is not None:
+            await self._write_coalescer.submit((tag_name, value))
+            return True
+        return await self._inner.write_tag_async(tag_name, value)
+
+    async def read_tags_batch(self, tag_names: List[str]) -> List[Union[PyPlcValue, Exception]]:
+        """
+        Read tags in batch, returning one value or Exception per tag in input order.
+
+        ``results[i]`` belongs to ``tag_names[i]``; names are not repeated in
+        the result. Use read_tags_batch_named for (name, value) pairs.
+
+        Lists longer than ``chunk_size`` are split into chunks that are read
+        concurrently, at most ``max_inflight`` at a time, so one chunk's
+        encoding and decoding overlap another's round trip.
+        """
+        size = self._chunk_size
+        if len(tag_names) <= size:
+            return await self._inner.read_tags_batch_async(tag_names)
+        if self._inflight is None:
+            self._inflight = asyncio.Semaphore(self._max_inflight)
+        chunks = [tag_names[i:i + size] for i in range(0, len(tag_names), size)]
+        # gather returns the chunk results in chunk order, so concatenating
+        # them preserves the input order
+        results = await asyncio.gather(*[self._read_chunk(chunk) for chunk in chunks])
+        return [result for chunk_results in results for result in chunk_results]
+
+    async def read_tags_batch_named(self, tag_names: List[str]) -> List[Tuple[str, Union[PyPlcValue, Exception]]]:
+        """Read tags in batch, returning (name, value or Exception) pairs in input order."""
+        return list(zip(tag_names, await self.read_tags_batch(tag_names)))
+
+    async def iter_read_tags(self, tag_names: List[str],
+                             chunk_size: Optional[int] = None) -> AsyncIterator[Tuple[str, Union[PyPlcValue, Exception]]]:
+        """
+        Read tags in chunks, yielding (name, value or Exception) as each chunk arrives.
+
+        Unlike read_tags_batch, the caller can start on the first chunk while
+        later ones are still in flight. Chunks are yielded in the order they
+        complete, not input order; tags within a chunk keep their order.
+        ``chunk_size`` defaults to the client's; ``max_inflight`` still
+        bounds how many chunks are outstanding. If the caller stops iterating
+        early, chunks not yet sent are skipped and chunks already sent are
+        awaited, not cancelled, so no request is abandoned mid-exchange.
+        """
+        size = chunk_size or self._chunk_size
+        if self._inflight is None:
+            self._inflight = asyncio.Semaphore(self._max_inflight)
+        stopped = False
+
+        async def read_chunk(chunk):
+            async with self._inflight:
+                if stopped:
+                    return chunk, []
+                return chunk, await self._inner.read_tags_batch_async(chunk)
+
+        loop = self._get_loop()
+        tasks = [loop.create_task(read_chunk(tag_names[i:i + size]))
+                 for i in range(0, len(tag_names), size)]
+        try:
+            for next_chunk in asyncio.as_completed(tasks):
+                names, values = await next_chunk
+                for result in zip(names, values):
+                    yield result
+        finally:
+            stopped = True
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _read_chunk(self, tag_names: List[str]) -> List[Union[PyPlcValue, Exception]]:
+        async with self._inflight:
+            return await self._inner.read_tags_batch_async(tag_names)
+
+    async def read_tags_batch_columns(self, tag_names: List[str], out: Optional[List[Any]] = None) -> PyBatchReadResult:
+        """
+        Read tags in batch and return the results as columns.
+
+        ``result.values[i]`` is the value of ``tag_names[i]``, or None if that
+        read failed. Failed positions are in ``result.error_indices``, with the
+        matching messages in ``result.error_messages``. Unlike
+        read_tags_batch, no Exception object is built per failed tag.
+        Scan loops can pass the previous ``result.values`` as ``out`` so one
+        list is reused from cycle to cycle.
+        """
+        return await self._inner.read_tags_batch_columns_async(tag_names, out)
+
+    async def read_tag_array(self, tag_name: str, count: int) -> Any:
+        """
+        Read the first ``count`` elements of a numeric or BOOL array tag.
+
+        The elements stay in one contiguous Rust buffer. With numpy installed
+        the result is a read-only ``numpy.ndarray`` viewing that buffer;
+        otherwise it is a ``memoryview`` of it. Neither copies the data or
+        builds a Python object per element.
+        """
+        array = await self._inner.read_tag_array_async(tag_name, count)
+        np = _numpy()
+        if np is not None:
+            return np.frombuffer(array, dtype=array.format)
+        return memoryview(array)
+
+    async def _write_results(self, tag_values: List[Tuple[str, PyPlcValue]]) -> List[Union[None, Exception]]:
+        """Batch write for the coalescer: per-tag results only, in input order."""
+        return [result for _, result in await self._inner.write_tags_batch_async(tag_values)]
 
     async def write_tags_batch(self, tag_values: List[Tuple[str, PyPlcValue]]) -> List[Tuple[str, Union[None, Exception]]]:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: self._inner.write_tags_batch(tag_values))
+        return await self._inner.write_tags_batch_async(tag_values)
+
+    def prewarm_paths(self, tag_names: List[str]) -> None:
+        """
+        Encode the CIP paths of ``tag_names`` now instead of on first use.
+
+        Paths are cached per client, so this only moves work that would
+        otherwise happen in the first scan; call it at startup with the tags
+        a scan loop polls.
+        """
+        self._inner.prewarm_paths(tag_names)
 
     async def unregister_session(self) -> None:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._inner.unregister_session)
+        """End the session and stop the keep-alive task. The client cannot be used afterwards."""
+        self._stop_keepalive()
+        return await self._inner.unregister_session_async()
 
     async def subscribe_to_tag(self, tag_name: str, options: Optional[PySubscriptionOptions] = None) -> None:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: self._inner.subscribe_to_tag(tag_name, options))
+        """Subscribe to one tag. To subscribe to several, use subscribe_to_tags."""
+        return await self._inner.subscribe_to_tag_async(tag_name, options)
 
     async def subscribe_to_tags(self, tags: List[Tuple[str, PySubscriptionOptions]]) -> None:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: self._inner.subscribe_to_tags(tags))
+        """
+        Subscribe to many tags in one call into the extension.
+
+        The list is converted once and handled entirely in Rust, so this costs
+        one boundary crossing however many tags it holds. Always prefer it to
+        calling subscribe_to_tag in a loop.
+        """
+        return await self._inner.subscribe_to_tags_async(tags)
+
+    # Blocking variants. These call the extension's synchronous methods
+    # directly: no event loop, executor hop or coroutine per call. The GIL is
+    # released while each call waits on the network.
+
+    def read_tag_sync(self, tag_name: str) -> PyPlcValue:
+        """
+        Read a tag, blocking until the PLC replies.
+
+        For plain scan loops that do not use asyncio. From async code, prefer
+        read_tag, or call this inside ``asyncio.to_thread(...)`` (or your own
+        executor) when you manage the threads yourself.
+        """
+        return self._inner.read_tag(tag_name)
+
+    def write_tag_sync(self, tag_name: str, value: PyPlcValue) -> bool:
+        """Write a tag, blocking until the PLC replies. See read_tag_sync."""
+        return self._inner.write_tag(tag_name, value)
+
+    def read_tags_batch_sync(self, tag_names: List[str]) -> List[Union[PyPlcValue, Exception]]:
+        """
+        Read tags in one blocking batch call. See read_tag_sync.
+
+        Like read_tags_batch, returns one value or Exception per tag in input
+        order.
+
+        The whole list goes to the extension in one call, which splits it
+        into CIP packets itself; there is no concurrent chunking.
+        """
+        return self._inner.read_tags_batch(tag_names)
 
 # Re-export types for convenience
 PlcValue = PyPlcValue
 SubscriptionOptions = PySubscriptionOptions
+BatchReadResult = PyBatchReadResult
+PlcArray = PyPlcArray
 
 __all__ = [
     'EipClient',
     'PlcValue',
     'SubscriptionOptions',
+    'BatchReadResult',
+    'PlcArray',
 ] 
\ No newline at end of file
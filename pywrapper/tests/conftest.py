@@ -1,3 +1,8 @@
+import socketserver
+import struct
+import threading
+import time
+
 import pytest
 from rust_ethernet_ip import PyEipClient, PyPlcValue
 
@@ -7,4 +12,68 @@ def connection():
 
 @pytest.fixture
 def value():
-    return PyPlcValue(42) 
\ No newline at end of file
+    return PyPlcValue.dint(42)
+
+# DINT value and reply delay in seconds for each tag the fake PLC knows
+FAKE_TAGS = {"Slow": (1, 0.2), "Fast": (2, 0.0)}
+# DINT array tags, and the most element data bytes per fragmented read reply
+FAKE_ARRAYS = {"Values": list(range(-50, 50))}
+FRAGMENT_BYTES = 40
+
+class FakePlcHandler(socketserver.BaseRequestHandler):
+    """Answers Register Session, NOP, single-tag Read Tag and Read Tag Fragmented requests."""
+
+    def recv_exact(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("client closed the connection")
+            data += chunk
+        return data
+
+    def reply(self, command, body):
+        header = struct.pack("<HHII8sI", command, len(body), 1, 0, b"\0" * 8, 0)
+        self.request.sendall(header + body)
+
+    def read_fragment(self, name, request_data):
+        count, offset = struct.unpack_from("<HI", request_data)
+        elements = struct.pack(f"<{count}i", *FAKE_ARRAYS[name][:count])
+        fragment = elements[offset:offset + FRAGMENT_BYTES]
+        status = 0x06 if offset + len(fragment) < len(elements) else 0x00
+        return struct.pack("<BBBBH", 0xD2, 0, status, 0, 0x00C4) + fragment
+
+    def handle(self):
+        try:
+            while True:
+                header = self.recv_exact(24)
+                command, length = struct.unpack_from("<HH", header)
+                body = self.recv_exact(length)
+                if command == 0x65:  # Register Session
+                    self.reply(command, body)
+                elif command == 0x6F:  # Send RR Data
+                    cip = body[16:]
+                    name_len = cip[3]
+                    name = cip[4:4 + name_len].decode()
+                    if cip[0] == 0x52:
+                        data = self.read_fragment(name, cip[2 + 2 * cip[1]:])
+                    else:
+                        value, delay = FAKE_TAGS[name]
+                        time.sleep(delay)
+                        data = struct.pack("<BBBBHi", 0xCC, 0, 0, 0, 0x00C4, value)
+                    cpf = struct.pack("<IHHHHHH", 0, 0, 2, 0, 0, 0xB2, len(data)) + data
+                    self.reply(command, cpf)
+        except (ConnectionError, OSError):
+            pass
+
+@pytest.fixture
+def fake_plc():
+    """Address of an in-process fake PLC serving FAKE_TAGS"""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakePlcHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"{host}:{port}"
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,180 @@
+import asyncio
+
+from rust_ethernet_ip import client as client_module
+from rust_ethernet_ip.client import EipClient, PlcValue
+
+
+class FakeInner:
+    """Stands in for PyEipClient, recording the batch calls it receives."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def read_tags_batch_async(self, tag_names):
+        self.calls.append(list(tag_names))
+        return [RuntimeError("read failed") if name == "Bad" else name.lower()
+                for name in tag_names]
+
+    async def send_keep_alive_async(self):
+        self.calls.append("keepalive")
+
+    async def unregister_session_async(self):
+        self.calls.append("unregister")
+
+    def read_tag(self, tag_name):
+        self.calls.append(tag_name)
+        return tag_name.lower()
+
+    async def write_tags_batch_async(self, tag_values):
+        self.calls.append(list(tag_values))
+        return [(name, None) for name, _ in tag_values]
+
+
+class GatedInner(FakeInner):
+    """A FakeInner whose batch reads each wait for one ``release`` and record when they finish."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.finished = []
+
+    async def read_tags_batch_async(self, tag_names):
+        self.calls.append(list(tag_names))
+        await self.release.wait()
+        self.release.clear()
+        self.finished.append(list(tag_names))
+        return [name.lower() for name in tag_names]
+
+
+def run_with_client(body, inner=None, **options):
+    """Run ``body(client, inner)`` on a fresh event loop and close the client after.
+
+    Returns ``(inner, result)``.
+    """
+    inner = inner if inner is not None else FakeInner()
+
+    async def run():
+        client = EipClient(inner, **options)
+        try:
+            return await body(client, inner)
+        finally:
+            await client.close()
+
+    return inner, asyncio.run(run())
+
+
+def test_coalesced_reads_share_batches():
+    inner, results = run_with_client(
+        lambda client, inner: asyncio.gather(
+            *[client.read_tag(name) for name in ["A", "B", "Bad", "C"]],
+            return_exceptions=True,
+        ),
+        coalesce=True,
+        max_batch=3,
+    )
+    assert inner.calls == [["A", "B", "Bad"], ["C"]]
+    assert results[0] == "a" and results[1] == "b" and results[3] == "c"
+    assert isinstance(results[2], RuntimeError)
+
+
+def test_coalesced_write():
+    value = PlcValue.dint(42)
+    inner, result = run_with_client(
+        lambda client, inner: client.write_tag("Counter", value), coalesce=True
+    )
+    assert result is True
+    assert inner.calls == [[("Counter", value)]]
+
+
+def test_close_lets_batch_in_flight_finish():
+    async def close_mid_batch(client, inner):
+        read = asyncio.ensure_future(client.read_tag("A"))
+        while not inner.calls:
+            await asyncio.sleep(0)
+        await client.close()
+        inner.release.set()
+        return await asyncio.wait_for(read, 1.0)
+
+    inner, result = run_with_client(close_mid_batch, inner=GatedInner(), coalesce=True)
+    assert result == "a"
+    assert inner.finished == [["A"]]
+
+
+def test_coalescer_rebinds_to_a_new_event_loop():
+    client = EipClient(FakeInner(), coalesce=True)
+
+    async def read(name):
+        return await asyncio.wait_for(client.read_tag(name), 1.0)
+
+    assert asyncio.run(read("A")) == "a"
+    assert asyncio.run(read("B")) == "b"
+
+
+def test_read_tags_batch_chunks_preserve_order():
+    inner, results = run_with_client(
+        lambda client, inner: client.read_tags_batch(["A", "B", "C", "D", "E"]),
+        chunk_size=2,
+        max_inflight=2,
+    )
+    assert sorted(inner.calls) == [["A", "B"], ["C", "D"], ["E"]]
+    assert results == ["a", "b", "c", "d", "e"]
+
+
+def test_read_tag_sync_calls_inner_directly():
+    inner = FakeInner()
+    client = EipClient(inner)
+    assert client.read_tag_sync("Counter") == "counter"
+    assert inner.calls == ["Counter"]
+
+
+def test_keepalive_runs_until_unregister(monkeypatch):
+    inner = FakeInner()
+    monkeypatch.setattr(client_module, "PyEipClient", lambda addr: inner)
+
+    async def run():
+        client = await EipClient.connect("192.168.0.1:44818", keepalive_interval=0.001)
+        try:
+            await asyncio.sleep(0.02)
+            await client.unregister_session()
+            sent = inner.calls.count("keepalive")
+            await asyncio.sleep(0.02)
+            return sent
+        finally:
+            await client.close()
+
+    sent = asyncio.run(run())
+    assert sent > 0
+    assert inner.calls.count("keepalive") == sent
+    assert inner.calls[-1] == "unregister"
+
+
+def test_iter_read_tags_yields_every_tag():
+    async def collect(client, inner):
+        return [result async for result in client.iter_read_tags(["A", "B", "Bad", "C", "D"])]
+
+    _, results = run_with_client(collect, chunk_size=2)
+    results = dict(results)
+    assert {name: results[name] for name in ["A", "B", "C", "D"]} == {"A": "a", "B": "b", "C": "c", "D": "d"}
+    assert isinstance(results["Bad"], RuntimeError)
+
+
+def test_iter_read_tags_stopped_early_does_not_cancel_sent_chunks():
+    async def take_first(client, inner):
+        results = client.iter_read_tags(["A", "B", "C", "D", "E", "F"])
+        first = asyncio.ensure_future(results.__anext__())
+        inner.release.set()
+        await first
+        # The next chunk may already be on the wire; closing has to wait for it
+        closing = asyncio.ensure_future(results.aclose())
+        while not closing.done():
+            inner.release.set()
+            await asyncio.sleep(0)
+
+    inner, _ = run_with_client(take_first, inner=GatedInner(), chunk_size=2, max_inflight=1)
+    assert inner.finished == inner.calls
+    assert len(inner.calls) < 3
+
+
+def test_read_tags_batch_named_pairs_names_with_values():
+    _, results = run_with_client(lambda client, inner: client.read_tags_batch_named(["A", "B"]))
+    assert results == [("A", "a"), ("B", "b")]
@@ -0,0 +1,15 @@
+import pytest
+from rust_ethernet_ip import PyPlcValue as PlcValue
+
+# These tests talk to the PLC in the connection fixture (conftest.py) and are
+# deselected by default; run them with `pytest -m live`.
+pytestmark = pytest.mark.live
+
+def test_connection_creation(connection):
+    assert connection is not None
+
+def test_read_write_tag(connection):
+    value = PlcValue.dint(42)
+    connection.write_tag("TestTag", value)
+    result = connection.read_tag("TestTag")
+    assert result.value == 42
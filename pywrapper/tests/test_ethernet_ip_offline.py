@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from rust_ethernet_ip import PyEipClient
+from rust_ethernet_ip import PyPlcArray as PlcArray
+from rust_ethernet_ip import PyPlcValue as PlcValue
+
+def test_plc_value():
+    value = PlcValue.dint(42)
+    assert value.value == 42
+
+def test_typed_factories():
+    assert PlcValue.bool_(True).value is True
+    assert PlcValue.sint(-5).value == -5
+    assert PlcValue.int_(300).value == 300
+    assert PlcValue.string("abc").value == "abc"
+
+def test_polymorphic_constructor_is_deprecated():
+    with pytest.deprecated_call():
+        assert PlcValue(42).value == 42
+
+def test_plc_array_buffer():
+    arr = PlcArray.from_values([PlcValue.dint(v) for v in (1, -2, 3)])
+    view = memoryview(arr)
+    assert arr.format == "i"
+    assert view.format == "i"
+    assert view.itemsize == 4
+    assert len(arr) == len(view) == 3
+    assert view.tolist() == [1, -2, 3]
+    assert view.readonly
+    with pytest.raises(TypeError):
+        view[0] = 5
+
+def test_plc_array_rejects_mixed_types():
+    with pytest.raises(TypeError):
+        PlcArray.from_values([PlcValue.dint(1), PlcValue.real(1.5)])
+
+def test_cancelled_read_does_not_desync_the_connection(fake_plc):
+    client = PyEipClient(fake_plc)
+
+    async def run():
+        # The PLC answers "Slow" after 0.2 s; give up on it while it is in flight
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.read_tag_async("Slow"), 0.05)
+        return (await client.read_tag_async("Fast")).value
+
+    assert asyncio.run(run()) == 2
+
+def test_read_tag_array_reassembles_fragments(fake_plc):
+    client = PyEipClient(fake_plc)
+    arr = client.read_tag_array("Values", 25)
+    assert arr.format == "i"
+    assert memoryview(arr).tolist() == list(range(-50, -25))
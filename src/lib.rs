@@ -261,6 +261,7 @@ use std::collections::HashMap;
 use std::net::SocketAddr;
 use std::sync::atomic::AtomicBool;
 use std::sync::Arc;
+use std::sync::Mutex as StdMutex;
 use tokio::io::{AsyncReadExt, AsyncWriteExt};
 use tokio::net::TcpStream;
 use tokio::runtime::Runtime;
@@ -302,7 +303,7 @@ pub use udt::{UdtDefinition, UdtMember};
 
 // Static runtime and client management for FFI
 lazy_static! {
-    /// Global Tokio runtime for handling async operations in FFI context
+    /// Global Tokio runtime for handling async operations in FFI and Python bindings
     static ref RUNTIME: Runtime = Runtime::new().unwrap();
 
     /// Global storage for EipClient instances, indexed by client ID
@@ -950,6 +951,10 @@ pub struct EipClient {
     connection_sequence: Arc<Mutex<u32>>,
     /// Active tag subscriptions
     subscriptions: Arc<Mutex<Vec<TagSubscription>>>,
+    /// Encoded CIP paths keyed by tag name, shared by clones of this client
+    tag_path_cache: Arc<StdMutex<HashMap<String, Arc<[u8]>>>>,
+    /// Polling tasks started by `subscribe_to_tag`, shared by clones of this client
+    subscription_tasks: Arc<StdMutex<Vec<tokio::task::JoinHandle<()>>>>,
 }
 
 impl EipClient {
@@ -972,6 +977,8 @@ impl EipClient {
             connected_sessions: Arc::new(Mutex::new(HashMap::new())),
             connection_sequence: Arc::new(Mutex::new(1)),
             subscriptions: Arc::new(Mutex::new(Vec::new())),
+            tag_path_cache: Arc::new(StdMutex::new(HashMap::new())),
+            subscription_tasks: Arc::new(StdMutex::new(Vec::new())),
         };
         client.register_session().await?;
         Ok(client)
@@ -1179,6 +1186,56 @@ impl EipClient {
         self.parse_cip_response(&cip_data)
     }
 
+    /// Reads `count` consecutive elements of an array tag, starting at element 0
+    ///
+    /// The elements are requested with Read Tag Fragmented (0x52), so the whole
+    /// range costs one request per reply-sized fragment instead of one service
+    /// per element. Returns the CIP data type code and the raw little-endian
+    /// element data as the PLC sent it. BOOL arrays come back as 0x00D3
+    /// (32-bit words of packed bits).
+    pub async fn read_tag_elements(
+        &mut self,
+        tag_name: &str,
+        count: u16,
+    ) -> crate::error::Result<(u16, Vec<u8>)> {
+        self.validate_session().await?;
+        let mut data = Vec::new();
+        loop {
+            let request = self.build_read_fragmented_request(tag_name, count, data.len() as u32);
+            let response = self.send_cip_request(&request).await?;
+            let cip_data = self.extract_cip_from_response(&response)?;
+            if cip_data.len() < 4 {
+                return Err(EtherNetIpError::Protocol(
+                    "CIP response too short".to_string(),
+                ));
+            }
+
+            // 0x06 (partial transfer) means more fragments follow
+            let general_status = cip_data[2];
+            if general_status != 0x00 && general_status != 0x06 {
+                return Err(EtherNetIpError::Protocol(format!(
+                    "CIP Error {}: {}",
+                    general_status,
+                    self.get_cip_error_message(general_status)
+                )));
+            }
+
+            // Data type and element data follow the additional status words
+            let pos = 4 + 2 * cip_data[3] as usize;
+            if cip_data.len() < pos + 2 {
+                return Err(EtherNetIpError::Protocol(
+                    "Read response too short for data".to_string(),
+                ));
+            }
+            let data_type = u16::from_le_bytes([cip_data[pos], cip_data[pos + 1]]);
+            data.extend_from_slice(&cip_data[pos + 2..]);
+
+            if general_status == 0x00 {
+                return Ok((data_type, data));
+            }
+        }
+    }
+
     /// Writes a value to a PLC tag
     ///
     /// This method automatically determines the best communication method based on the data type:
@@ -1346,24 +1403,14 @@ impl EipClient {
         // Service: Write Tag Service (0x4D)
         cip_request.push(0x4D);
 
-        // Request Path Size (in words)
-        let tag_bytes = tag_name.as_bytes();
-        let path_len = if tag_bytes.len() % 2 == 0 {
-            tag_bytes.len() + 2
-        } else {
-            tag_bytes.len() + 3
-        };
-        cip_request.push((path_len / 2) as u8);
+        // Build the path based on tag name format
+        let path = self.build_tag_path(tag_name);
 
-        // Request Path: ANSI Extended Symbol Segment for tag name
-        cip_request.push(0x91); // ANSI Extended Symbol Segment
-        cip_request.push(tag_bytes.len() as u8); // Tag name length
-        cip_request.extend_from_slice(tag_bytes); // Tag name
+        // Request Path Size (in words)
+        cip_request.push((path.len() / 2) as u8);
 
-        // Pad to even length if necessary
-        if tag_bytes.len() % 2 != 0 {
-            cip_request.push(0x00);
-        }
+        // Request Path
+        cip_request.extend_from_slice(&path);
 
         // Add data type and element count
         let data_type = value.get_data_type();
@@ -1395,7 +1442,7 @@ impl EipClient {
 
         // Build tag path
         let tag_path = self.build_tag_path(tag_name);
-        request.extend(tag_path);
+        request.extend_from_slice(&tag_path);
 
         // Add raw data
         request.extend(data);
@@ -1593,11 +1640,19 @@ impl EipClient {
         Ok(())
     }
 
-    async fn send_keep_alive(&mut self) -> crate::error::Result<()> {
-        let packet = vec![
-            0x6F, 0x00, // Command: SendRRData
-            0x00, 0x00, // Length: 0
-        ];
+    /// Sends an encapsulation NOP to keep an idle session open
+    ///
+    /// The PLC does not reply to NOP, so this only writes to the socket, but it
+    /// counts as traffic for the PLC's encapsulation inactivity timeout. Long-lived
+    /// clients that may sit idle call this periodically.
+    pub async fn send_keep_alive(&self) -> crate::error::Result<()> {
+        let mut packet = Vec::with_capacity(24);
+        packet.extend_from_slice(&[0x00, 0x00]); // Command: NOP
+        packet.extend_from_slice(&[0x00, 0x00]); // Length: 0
+        packet.extend_from_slice(&self.session_handle.to_le_bytes()); // Session handle
+        packet.extend_from_slice(&[0x00, 0x00, 0x00, 0x00]); // Status
+        packet.extend_from_slice(&[0x00; 8]); // Sender context
+        packet.extend_from_slice(&[0x00, 0x00, 0x00, 0x00]); // Options
 
         let mut stream = self.stream.lock().await;
         stream.write_all(&packet).await?;
@@ -2088,8 +2143,54 @@ impl EipClient {
         cip_request
     }
 
+    /// Builds a Read Tag Fragmented request for `count` elements, starting
+    /// `byte_offset` bytes into the reply data
+    fn build_read_fragmented_request(
+        &self,
+        tag_name: &str,
+        count: u16,
+        byte_offset: u32,
+    ) -> Vec<u8> {
+        let path = self.build_tag_path(tag_name);
+
+        let mut cip_request = Vec::with_capacity(2 + path.len() + 6);
+        cip_request.push(0x52); // Service: Read Tag Fragmented
+        cip_request.push((path.len() / 2) as u8); // Request Path Size (in words)
+        cip_request.extend_from_slice(&path);
+        cip_request.extend_from_slice(&count.to_le_bytes()); // Element count
+        cip_request.extend_from_slice(&byte_offset.to_le_bytes()); // Byte offset
+
+        cip_request
+    }
+
+    /// Pre-encodes the CIP paths for the given tags
+    ///
+    /// Paths are cached on first use anyway; calling this at startup with the
+    /// tags a scan loop will poll moves that cost out of the first scan.
+    pub fn prewarm_tag_paths(&self, tag_names: &[&str]) {
+        for tag_name in tag_names {
+            self.build_tag_path(tag_name);
+        }
+    }
+
+    /// Returns the encoded path for a tag name, encoding it on first use
+    ///
+    /// The cache is unbounded: it holds one entry per distinct tag name this
+    /// client (or any clone of it) has addressed.
+    fn build_tag_path(&self, tag_name: &str) -> Arc<[u8]> {
+        if let Some(path) = self.tag_path_cache.lock().unwrap().get(tag_name) {
+            return Arc::clone(path);
+        }
+        let path: Arc<[u8]> = self.encode_tag_path(tag_name).into();
+        self.tag_path_cache
+            .lock()
+            .unwrap()
+            .insert(tag_name.to_string(), Arc::clone(&path));
+        path
+    }
+
     /// Builds the correct path for a tag name
-    fn build_tag_path(&self, tag_name: &str) -> Vec<u8> {
+    fn encode_tag_path(&self, tag_name: &str) -> Vec<u8> {
         let mut path = Vec::new();
 
         if tag_name.starts_with("Program:") {
@@ -4057,7 +4158,7 @@ impl EipClient {
 
         let tag_path = tag_path.to_string();
         let mut client = self.clone();
-        tokio::spawn(async move {
+        let task = tokio::spawn(async move {
             loop {
                 match client.read_tag(&tag_path).await {
                     Ok(value) => {
@@ -4074,9 +4175,21 @@ impl EipClient {
                 tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
             }
         });
+        self.subscription_tasks.lock().unwrap().push(task);
         Ok(())
     }
 
+    /// Stops the polling tasks started by `subscribe_to_tag`
+    ///
+    /// The tasks run on the runtime, not on this client, and each holds a
+    /// clone of the connection, so they outlive the client unless stopped.
+    /// Owners that drop a client with active subscriptions call this first.
+    pub fn stop_subscriptions(&self) {
+        for task in self.subscription_tasks.lock().unwrap().drain(..) {
+            task.abort();
+        }
+    }
+
     pub async fn subscribe_to_tags(&self, tags: &[(&str, SubscriptionOptions)]) -> Result<()> {
         for (tag_name, options) in tags {
             self.subscribe_to_tag(tag_name, options.clone()).await?;
@@ -1,18 +1,27 @@
 #![allow(non_local_definitions)]
 
-use crate::{EipClient, PlcValue, SubscriptionOptions};
+use crate::{BatchError, EipClient, PlcValue, SubscriptionOptions, RUNTIME};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyTuple};
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyDict, PyList, PyTuple};
 use pyo3::IntoPyObjectExt;
 use std::collections::HashMap;
-use tokio::runtime::Runtime;
+use std::future::Future;
+use std::os::raw::{c_char, c_int, c_void};
+use std::ptr;
 
 /// Python module for rust_ethernet_ip
 #[pymodule]
 fn rust_ethernet_ip(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
+    // Awaitables and blocking calls run on the crate's one runtime, so every
+    // client shares a worker pool and each stream is driven by the runtime
+    // it was opened on. Fails only if already initialized, which is harmless.
+    let _ = pyo3_async_runtimes::tokio::init_with_runtime(&*RUNTIME);
     m.add_class::<PyEipClient>()?;
     m.add_class::<PyPlcValue>()?;
     m.add_class::<PySubscriptionOptions>()?;
+    m.add_class::<PyBatchReadResult>()?;
+    m.add_class::<PyPlcArray>()?;
     Ok(())
 }
 
@@ -20,7 +29,6 @@ fn rust_ethernet_ip(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
 #[pyclass]
 struct PyEipClient {
     client: EipClient,
-    runtime: Runtime,
 }
 
 // Newtype for (String, PyPlcValue)
@@ -58,176 +66,643 @@ impl<'a> FromPyObject<'a> for TagSubOptArg {
             ));
         }
         let name = tuple.get_item(0)?.extract::<String>()?;
-        let options = tuple.get_item(1)?.extract::<PySubscriptionOptions>()?;
+        let item = tuple.get_item(1)?;
+        // PySubscriptionOptions instances are copied straight out of the Rust
+        // struct; only duck-typed objects go through the three getattr calls.
+        let options = match item.downcast::<PySubscriptionOptions>() {
+            Ok(opts) => PySubscriptionOptions {
+                options: opts.borrow().options.clone(),
+            },
+            Err(_) => item.extract::<PySubscriptionOptions>()?,
+        };
         Ok(TagSubOptArg { name, options })
     }
 }
 
+/// Convert one batch read result into a `PyPlcValue` or `RuntimeError` object
+fn read_result_into_py<'py>(
+    py: Python<'py>,
+    result: std::result::Result<PlcValue, BatchError>,
+) -> PyResult<Bound<'py, PyAny>> {
+    match result {
+        Ok(v) => plc_value_into_py(py, v)?.into_bound_py_any(py),
+        Err(e) => {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()).into_bound_py_any(py)
+        }
+    }
+}
+
+/// Convert batch read results into `PyPlcValue | RuntimeError` values, in request order
+fn read_results_into_values(
+    py: Python<'_>,
+    results: Vec<(String, std::result::Result<PlcValue, BatchError>)>,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let mut values = Vec::with_capacity(results.len());
+    for (_, result) in results {
+        values.push(read_result_into_py(py, result)?.unbind());
+    }
+    Ok(values)
+}
+
+/// Convert batch read results into `(name, PyPlcValue | RuntimeError)` pairs
+fn read_results_into_py(
+    py: Python<'_>,
+    results: Vec<(String, std::result::Result<PlcValue, BatchError>)>,
+) -> PyResult<Vec<(String, Py<PyAny>)>> {
+    let mut results_vec = Vec::with_capacity(results.len());
+    for (name, result) in results {
+        let obj = read_result_into_py(py, result)?;
+        results_vec.push((name, obj.unbind()));
+    }
+    Ok(results_vec)
+}
+
+/// Column-oriented result of a batch read
+///
+/// `values[i]` holds the value of the i-th requested tag, or None if that read
+/// failed. Failed slots are listed in `error_indices`, with the matching text in
+/// `error_messages`. Tag names are not repeated, and no per-tag tuple or
+/// exception objects are created.
+#[pyclass(get_all)]
+struct PyBatchReadResult {
+    values: Py<PyList>,
+    error_indices: Vec<usize>,
+    error_messages: Vec<String>,
+}
+
+/// Convert batch read results into a `PyBatchReadResult`
+///
+/// When `out` is given its list object is reused for `values`. If it already
+/// has one slot per tag the slots are overwritten in place; otherwise it is
+/// cleared and refilled.
+fn read_results_into_columns(
+    py: Python<'_>,
+    results: Vec<(String, std::result::Result<PlcValue, BatchError>)>,
+    out: Option<Py<PyList>>,
+) -> PyResult<PyBatchReadResult> {
+    let values = out.unwrap_or_else(|| PyList::empty(py).unbind());
+    let list = values.bind(py);
+    let in_place = list.len() == results.len();
+    if !in_place {
+        list.del_slice(0, list.len())?;
+    }
+
+    let mut error_indices = Vec::new();
+    let mut error_messages = Vec::new();
+    for (i, (_, result)) in results.into_iter().enumerate() {
+        let obj = match result {
+            Ok(v) => plc_value_into_py(py, v)?.into_bound_py_any(py)?,
+            Err(e) => {
+                error_indices.push(i);
+                error_messages.push(e.to_string());
+                py.None().into_bound_py_any(py)?
+            }
+        };
+        if in_place {
+            list.set_item(i, obj)?;
+        } else {
+            list.append(obj)?;
+        }
+    }
+    Ok(PyBatchReadResult {
+        values,
+        error_indices,
+        error_messages,
+    })
+}
+
+/// Convert batch write results into `(name, None | RuntimeError)` pairs
+fn write_results_into_py(
+    py: Python<'_>,
+    results: Vec<(String, std::result::Result<(), BatchError>)>,
+) -> PyResult<Vec<(String, Py<PyAny>)>> {
+    let mut results_vec = Vec::with_capacity(results.len());
+    for (name, result) in results {
+        let obj = match result {
+            Ok(()) => py.None().into_bound_py_any(py)?,
+            Err(e) => PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
+                .into_bound_py_any(py)?,
+        };
+        results_vec.push((name, obj.unbind()));
+    }
+    Ok(results_vec)
+}
+
+// Every method works on a clone of the client. EipClient keeps its stream and
+// session state behind Arcs, so clones share one connection, and the stream
+// lock is held for a whole request/response exchange. Taking `&self` instead
+// of `&mut self` lets several Python threads call into the same PyEipClient
+// while the GIL is released, instead of failing with "Already borrowed".
+impl Drop for PyEipClient {
+    fn drop(&mut self) {
+        // Subscription polling tasks run on the shared RUNTIME and hold a
+        // clone of the connection; stop them so dropping the client closes it
+        self.client.stop_subscriptions();
+    }
+}
+
 #[pymethods]
 impl PyEipClient {
     /// Create a new EipClient instance
     #[new]
-    fn new(addr: &str) -> PyResult<Self> {
-        let runtime = Runtime::new().unwrap();
-        let client = runtime
-            .block_on(async { EipClient::connect(addr).await })
+    fn new(py: Python<'_>, addr: &str) -> PyResult<Self> {
+        let client = py
+            .detach(|| RUNTIME.block_on(async { EipClient::connect(addr).await }))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
-        Ok(PyEipClient { client, runtime })
+        Ok(PyEipClient { client })
     }
 
     /// Read a tag value
-    fn read_tag(&mut self, tag_name: &str) -> PyResult<PyPlcValue> {
-        let value = self
-            .runtime
-            .block_on(async { self.client.read_tag(tag_name).await })
+    fn read_tag(&self, py: Python<'_>, tag_name: &str) -> PyResult<Py<PyPlcValue>> {
+        let mut client = self.client.clone();
+        let value = py
+            .detach(|| RUNTIME.block_on(client.read_tag(tag_name)))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
-        Ok(PyPlcValue { value })
+        plc_value_into_py(py, value)
     }
 
     /// Write a value to a tag
-    fn write_tag(&mut self, tag_name: &str, value: &PyPlcValue) -> PyResult<bool> {
-        let result = self
-            .runtime
-            .block_on(async { self.client.write_tag(tag_name, value.value.clone()).await });
-        match result {
-            Ok(_) => Ok(true),
-            Err(e) => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
-                e.to_string(),
-            )),
-        }
+    fn write_tag(&self, py: Python<'_>, tag_name: &str, value: &PyPlcValue) -> PyResult<bool> {
+        let mut client = self.client.clone();
+        let value = value.value.clone();
+        py.detach(|| RUNTIME.block_on(client.write_tag(tag_name, value)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+
+        Ok(true)
     }
 
     /// Read multiple tags in batch
-    fn read_tags_batch(&mut self, tag_names: Vec<String>) -> PyResult<Vec<(String, Py<PyAny>)>> {
-        Python::attach(|py| {
-            let runtime = tokio::runtime::Runtime::new().unwrap();
-            let results = runtime
-                .block_on(async {
-                    self.client
-                        .read_tags_batch(&tag_names.iter().map(|s| s.as_str()).collect::<Vec<_>>())
-                        .await
-                })
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-            let mut results_vec = Vec::new();
-            for (name, result) in results {
-                let obj = match result {
-                    Ok(v) => PyPlcValue { value: v }.into_bound_py_any(py)?,
-                    Err(e) => PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
-                        .into_bound_py_any(py)?,
-                };
-                results_vec.push((name, obj.unbind()));
-            }
-            Ok(results_vec)
-        })
+    ///
+    /// Returns one `PyPlcValue` or `RuntimeError` per tag, in the order of
+    /// `tag_names`.
+    fn read_tags_batch(&self, py: Python<'_>, tag_names: Vec<String>) -> PyResult<Vec<Py<PyAny>>> {
+        let mut client = self.client.clone();
+        let names = tag_names.iter().map(|s| s.as_str()).collect::<Vec<_>>();
+        let results = py
+            .detach(|| RUNTIME.block_on(client.read_tags_batch(&names)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        read_results_into_values(py, results)
+    }
+
+    /// Read multiple tags in batch, returning `(name, PyPlcValue | RuntimeError)` pairs
+    fn read_tags_batch_named(
+        &self,
+        py: Python<'_>,
+        tag_names: Vec<String>,
+    ) -> PyResult<Vec<(String, Py<PyAny>)>> {
+        let mut client = self.client.clone();
+        let names = tag_names.iter().map(|s| s.as_str()).collect::<Vec<_>>();
+        let results = py
+            .detach(|| RUNTIME.block_on(client.read_tags_batch(&names)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        read_results_into_py(py, results)
+    }
+
+    /// Read multiple tags in batch into a column-oriented `PyBatchReadResult`
+    ///
+    /// Pass the previous result's `values` list as `out` to reuse it across
+    /// scan cycles.
+    #[pyo3(signature = (tag_names, out=None))]
+    fn read_tags_batch_columns(
+        &self,
+        py: Python<'_>,
+        tag_names: Vec<String>,
+        out: Option<Py<PyList>>,
+    ) -> PyResult<PyBatchReadResult> {
+        let mut client = self.client.clone();
+        let names = tag_names.iter().map(|s| s.as_str()).collect::<Vec<_>>();
+        let results = py
+            .detach(|| RUNTIME.block_on(client.read_tags_batch(&names)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        read_results_into_columns(py, results, out)
+    }
+
+    /// Read `count` elements of a numeric or BOOL array tag as a `PyPlcArray`
+    ///
+    /// Elements `tag_name[0]` to `tag_name[count - 1]` are read with one
+    /// element-count read request and decoded straight into the array buffer.
+    fn read_tag_array(&self, py: Python<'_>, tag_name: &str, count: u16) -> PyResult<PyPlcArray> {
+        if count == 0 {
+            return Ok(PyPlcArray::from_data(ArrayData::Dint(Vec::new())));
+        }
+        let mut client = self.client.clone();
+        let (data_type, data) = py
+            .detach(|| RUNTIME.block_on(client.read_tag_elements(tag_name, count)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        PyPlcArray::from_cip(data_type, &data, count as usize)
     }
 
     /// Write multiple tags in batch
     fn write_tags_batch(
-        &mut self,
+        &self,
+        py: Python<'_>,
         tag_values: Vec<TagValueArg>,
     ) -> PyResult<Vec<(String, Py<PyAny>)>> {
-        Python::attach(|py| {
-            let runtime = tokio::runtime::Runtime::new().unwrap();
-            let results = runtime
-                .block_on(async {
-                    self.client
-                        .write_tags_batch(
-                            &tag_values
-                                .iter()
-                                .map(|arg| (arg.name.as_str(), arg.value.value.clone()))
-                                .collect::<Vec<_>>(),
-                        )
-                        .await
-                })
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-            let mut results_vec = Vec::new();
-            for (name, result) in results {
-                let obj = match result {
-                    Ok(()) => py.None().into_bound_py_any(py)?,
-                    Err(e) => PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
-                        .into_bound_py_any(py)?,
-                };
-                results_vec.push((name, obj.unbind()));
-            }
-            Ok(results_vec)
-        })
+        let mut client = self.client.clone();
+        let values = tag_values
+            .iter()
+            .map(|arg| (arg.name.as_str(), arg.value.value.clone()))
+            .collect::<Vec<_>>();
+        let results = py
+            .detach(|| RUNTIME.block_on(client.write_tags_batch(&values)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        write_results_into_py(py, results)
     }
 
     /// Subscribe to a tag
-    fn subscribe_to_tag(&self, tag_path: &str, options: &PySubscriptionOptions) -> PyResult<()> {
-        self.runtime
-            .block_on(async {
-                self.client
-                    .subscribe_to_tag(tag_path, options.options.clone())
-                    .await
-            })
+    fn subscribe_to_tag(
+        &self,
+        py: Python<'_>,
+        tag_path: &str,
+        options: &PySubscriptionOptions,
+    ) -> PyResult<()> {
+        let options = options.options.clone();
+        py.detach(|| RUNTIME.block_on(self.client.subscribe_to_tag(tag_path, options)))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
         Ok(())
     }
 
     /// Subscribe to multiple tags
-    fn subscribe_to_tags(&self, tags: Vec<TagSubOptArg>) -> PyResult<()> {
-        self.runtime
-            .block_on(async {
-                self.client
-                    .subscribe_to_tags(
-                        &tags
-                            .iter()
-                            .map(|arg| (arg.name.as_str(), arg.options.options.clone()))
-                            .collect::<Vec<_>>(),
-                    )
-                    .await
-            })
+    ///
+    /// The whole list is converted once at the boundary and subscribed in a
+    /// single call with the GIL released; prefer this over looping on
+    /// `subscribe_to_tag`.
+    fn subscribe_to_tags(&self, py: Python<'_>, tags: Vec<TagSubOptArg>) -> PyResult<()> {
+        let tags = tags
+            .iter()
+            .map(|arg| (arg.name.as_str(), arg.options.options.clone()))
+            .collect::<Vec<_>>();
+        py.detach(|| RUNTIME.block_on(self.client.subscribe_to_tags(&tags)))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
         Ok(())
     }
 
     /// Unregister the session
-    fn unregister_session(&mut self) -> PyResult<()> {
-        self.runtime
-            .block_on(async { self.client.unregister_session().await })
+    fn unregister_session(&self, py: Python<'_>) -> PyResult<()> {
+        let mut client = self.client.clone();
+        py.detach(|| RUNTIME.block_on(client.unregister_session()))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
         Ok(())
     }
+
+    /// Pre-encode the CIP paths of tags that will be read or written repeatedly
+    fn prewarm_paths(&self, tag_names: Vec<String>) {
+        let names = tag_names.iter().map(|s| s.as_str()).collect::<Vec<_>>();
+        self.client.prewarm_tag_paths(&names);
+    }
+
+    // Awaitable variants. Each returns a Python awaitable driven by the Tokio
+    // runtime, so asyncio callers need no executor thread and the GIL is free
+    // while the request is on the wire. The client call itself runs in a task
+    // of its own (see `run_to_completion`), so cancelling the awaitable never
+    // abandons a request halfway through its exchange with the PLC.
+
+    /// Read a tag value; returns an awaitable
+    fn read_tag_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_name: String,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let mut client = self.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let value = run_to_completion(async move { client.read_tag(&tag_name).await }).await?;
+            Python::attach(|py| plc_value_into_py(py, value))
+        })
+    }
+
+    /// Write a value to a tag; returns an awaitable
+    fn write_tag_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_name: String,
+        value: &PyPlcValue,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let mut client = self.client.clone();
+        let value = value.value.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            run_to_completion(async move { client.write_tag(&tag_name, value).await }).await?;
+            Ok(true)
+        })
+    }
+
+    /// Read multiple tags in batch; returns an awaitable
+    fn read_tags_batch_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_names: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let results = run_to_completion(read_batch(client, tag_names)).await?;
+            Python::attach(|py| read_results_into_values(py, results))
+        })
+    }
+
+    /// Read multiple tags in batch as `(name, value)` pairs; returns an awaitable
+    fn read_tags_batch_named_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_names: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let results = run_to_completion(read_batch(client, tag_names)).await?;
+            Python::attach(|py| read_results_into_py(py, results))
+        })
+    }
+
+    /// Read multiple tags in batch into a `PyBatchReadResult`; returns an awaitable
+    #[pyo3(signature = (tag_names, out=None))]
+    fn read_tags_batch_columns_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_names: Vec<String>,
+        out: Option<Py<PyList>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let results = run_to_completion(read_batch(client, tag_names)).await?;
+            Python::attach(|py| read_results_into_columns(py, results, out))
+        })
+    }
+
+    /// Read `count` elements of an array tag as a `PyPlcArray`; returns an awaitable
+    fn read_tag_array_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_name: String,
+        count: u16,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let mut client = self.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            if count == 0 {
+                return Ok(PyPlcArray::from_data(ArrayData::Dint(Vec::new())));
+            }
+            let (data_type, data) =
+                run_to_completion(async move { client.read_tag_elements(&tag_name, count).await })
+                    .await?;
+            PyPlcArray::from_cip(data_type, &data, count as usize)
+        })
+    }
+
+    /// Write multiple tags in batch; returns an awaitable
+    fn write_tags_batch_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_values: Vec<TagValueArg>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let mut client = self.client.clone();
+        let values = tag_values
+            .into_iter()
+            .map(|arg| (arg.name, arg.value.value))
+            .collect::<Vec<_>>();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let results = run_to_completion(async move {
+                let values = values
+                    .iter()
+                    .map(|(name, value)| (name.as_str(), value.clone()))
+                    .collect::<Vec<_>>();
+                client.write_tags_batch(&values).await
+            })
+            .await?;
+            Python::attach(|py| write_results_into_py(py, results))
+        })
+    }
+
+    /// Subscribe to a tag; returns an awaitable
+    fn subscribe_to_tag_async<'py>(
+        &self,
+        py: Python<'py>,
+        tag_path: String,
+        options: &PySubscriptionOptions,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        let options = options.options.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            run_to_completion(async move { client.subscribe_to_tag(&tag_path, options).await })
+                .await?;
+            Ok(())
+        })
+    }
+
+    /// Subscribe to multiple tags; returns an awaitable
+    fn subscribe_to_tags_async<'py>(
+        &self,
+        py: Python<'py>,
+        tags: Vec<TagSubOptArg>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        let tags = tags
+            .into_iter()
+            .map(|arg| (arg.name, arg.options.options))
+            .collect::<Vec<_>>();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            run_to_completion(async move {
+                let tags = tags
+                    .iter()
+                    .map(|(name, options)| (name.as_str(), options.clone()))
+                    .collect::<Vec<_>>();
+                client.subscribe_to_tags(&tags).await
+            })
+            .await?;
+            Ok(())
+        })
+    }
+
+    /// Send an encapsulation NOP to keep an idle session open; returns an awaitable
+    fn send_keep_alive_async<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            run_to_completion(async move { client.send_keep_alive().await }).await?;
+            Ok(())
+        })
+    }
+
+    /// Unregister the session; returns an awaitable
+    fn unregister_session_async<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let mut client = self.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            run_to_completion(async move { client.unregister_session().await }).await?;
+            Ok(())
+        })
+    }
+}
+
+/// Run a client call to completion on the shared runtime and return its result
+///
+/// The call is spawned as its own task and only its `JoinHandle` is awaited.
+/// Dropping the returned future (the Python awaitable was cancelled) stops the
+/// wait but not the call, so a request already written to the socket still
+/// reads its reply and the next request on the stream gets its own answer.
+async fn run_to_completion<F, T>(call: F) -> PyResult<T>
+where
+    F: Future<Output = crate::Result<T>> + Send + 'static,
+    T: Send + 'static,
+{
+    RUNTIME
+        .spawn(call)
+        .await
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+}
+
+/// `read_tags_batch` on an owned client and owned names, for `run_to_completion`
+async fn read_batch(
+    mut client: EipClient,
+    tag_names: Vec<String>,
+) -> crate::Result<Vec<(String, std::result::Result<PlcValue, BatchError>)>> {
+    let names = tag_names.iter().map(|s| s.as_str()).collect::<Vec<_>>();
+    client.read_tags_batch(&names).await
 }
 
 /// Python wrapper for PlcValue
-#[pyclass]
+///
+/// Instances are immutable, so small DINTs can share one object (see
+/// `plc_value_into_py`).
+#[pyclass(frozen)]
 struct PyPlcValue {
     value: PlcValue,
 }
 
+/// Number of DINT values, starting at 0, with a shared `PyPlcValue`
+const SMALL_DINT_COUNT: i32 = 256;
+
+/// Shared `PyPlcValue` instances for DINT values 0..SMALL_DINT_COUNT
+static SMALL_DINTS: PyOnceLock<Vec<Py<PyPlcValue>>> = PyOnceLock::new();
+
+/// Wrap a PlcValue for Python, reusing the shared instance for small DINTs
+fn plc_value_into_py(py: Python<'_>, value: PlcValue) -> PyResult<Py<PyPlcValue>> {
+    if let PlcValue::Dint(i) = value {
+        if (0..SMALL_DINT_COUNT).contains(&i) {
+            let small_dints = SMALL_DINTS.get_or_try_init(py, || {
+                (0..SMALL_DINT_COUNT)
+                    .map(|i| {
+                        Py::new(
+                            py,
+                            PyPlcValue {
+                                value: PlcValue::Dint(i),
+                            },
+                        )
+                    })
+                    .collect::<PyResult<Vec<_>>>()
+            })?;
+            return Ok(small_dints[i as usize].clone_ref(py));
+        }
+    }
+    Py::new(py, PyPlcValue { value })
+}
+
+/// Convert a PlcValue to the matching native Python object
+fn plc_value_to_native(py: Python<'_>, value: &PlcValue) -> PyResult<Py<PyAny>> {
+    match value {
+        PlcValue::Bool(b) => Ok(b.into_bound_py_any(py)?.unbind()),
+        PlcValue::Sint(i) => Ok(i.into_bound_py_any(py)?.unbind()),
+        PlcValue::Int(i) => Ok(i.into_bound_py_any(py)?.unbind()),
+        PlcValue::Dint(i) => Ok(i.into_bound_py_any(py)?.unbind()),
+        PlcValue::Lint(i) => Ok(i.into_bound_py_any(py)?.unbind()),
+        PlcValue::Usint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
+        PlcValue::Uint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
+        PlcValue::Udint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
+        PlcValue::Ulint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
+        PlcValue::Real(f) => Ok(f.into_bound_py_any(py)?.unbind()),
+        PlcValue::Lreal(f) => Ok(f.into_bound_py_any(py)?.unbind()),
+        PlcValue::String(s) => Ok(s.into_bound_py_any(py)?.unbind()),
+        PlcValue::Udt(map) => {
+            let dict = PyDict::new(py);
+            for (k, v) in map.iter() {
+                dict.set_item(k, plc_value_to_native(py, v)?)?;
+            }
+            Ok(dict.unbind().into())
+        }
+    }
+}
+
+/// Emit the DeprecationWarning for building a PyPlcValue from a plain Python value
+fn warn_untyped_value(py: Python<'_>) -> PyResult<()> {
+    PyErr::warn(
+        py,
+        &py.get_type::<pyo3::exceptions::PyDeprecationWarning>(),
+        pyo3::ffi::c_str!(
+            "PyPlcValue(value) is deprecated; use a typed factory such as PyPlcValue.dint(value)"
+        ),
+        1,
+    )
+}
+
+// Plain bool, int, float and str values are still accepted wherever a
+// PyPlcValue is expected, with the same DeprecationWarning as the
+// polymorphic constructor. UDT dicts have no factory, so neither a dict nor
+// the plain values of its members warn.
 impl FromPyObject<'_> for PyPlcValue {
     fn extract_bound(ob: &Bound<'_, PyAny>) -> PyResult<Self> {
-        if let Ok(bool_val) = ob.extract::<bool>() {
-            Ok(PyPlcValue {
-                value: PlcValue::Bool(bool_val),
-            })
-        } else if let Ok(int_val) = ob.extract::<i32>() {
+        extract_plc_value(ob, true)
+    }
+}
+
+/// Convert a PyPlcValue or plain Python value; `warn` is false for UDT members
+fn extract_plc_value(ob: &Bound<'_, PyAny>, warn: bool) -> PyResult<PyPlcValue> {
+    if let Ok(plc_value) = ob.downcast::<PyPlcValue>() {
+        return Ok(PyPlcValue {
+            value: plc_value.get().value.clone(),
+        });
+    }
+    let value = if let Ok(bool_val) = ob.extract::<bool>() {
+        PlcValue::Bool(bool_val)
+    } else if let Ok(int_val) = ob.extract::<i32>() {
+        PlcValue::Dint(int_val)
+    } else if let Ok(float_val) = ob.extract::<f64>() {
+        PlcValue::Lreal(float_val)
+    } else if let Ok(string_val) = ob.extract::<String>() {
+        PlcValue::String(string_val)
+    } else if let Ok(dict) = ob.downcast::<PyDict>() {
+        let mut map = HashMap::new();
+        for (key, value) in dict.iter() {
+            let key = key.extract::<String>()?;
+            let value = extract_plc_value(&value, false)?.value;
+            map.insert(key, value);
+        }
+        return Ok(PyPlcValue {
+            value: PlcValue::Udt(map),
+        });
+    } else {
+        return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "Unsupported value type",
+        ));
+    };
+    if warn {
+        warn_untyped_value(ob.py())?;
+    }
+    Ok(PyPlcValue { value })
+}
+
+#[pymethods]
+impl PyPlcValue {
+    /// Build a value by inspecting the Python type of `value`
+    ///
+    /// Deprecated: use the typed factories (`dint`, `real`, `bool_`, ...),
+    /// which construct the value directly and state the PLC type explicitly.
+    #[new]
+    fn new(py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<Self> {
+        warn_untyped_value(py)?;
+        if let Ok(val) = value.extract::<bool>() {
             Ok(PyPlcValue {
-                value: PlcValue::Dint(int_val),
+                value: PlcValue::Bool(val),
             })
-        } else if let Ok(float_val) = ob.extract::<f64>() {
+        } else if let Ok(val) = value.extract::<i32>() {
             Ok(PyPlcValue {
-                value: PlcValue::Lreal(float_val),
+                value: PlcValue::Dint(val),
             })
-        } else if let Ok(string_val) = ob.extract::<String>() {
+        } else if let Ok(val) = value.extract::<f32>() {
             Ok(PyPlcValue {
-                value: PlcValue::String(string_val),
+                value: PlcValue::Real(val),
             })
-        } else if let Ok(dict) = ob.downcast::<PyDict>() {
-            let mut map = HashMap::new();
-            for (key, value) in dict.iter() {
-                let key = key.extract::<String>()?;
-                let value = value.extract::<PyPlcValue>()?.value;
-                map.insert(key, value);
-            }
+        } else if let Ok(val) = value.extract::<String>() {
             Ok(PyPlcValue {
-                value: PlcValue::Udt(map),
+                value: PlcValue::String(val),
             })
         } else {
             Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
@@ -235,42 +710,28 @@ impl FromPyObject<'_> for PyPlcValue {
             ))
         }
     }
-}
 
-#[pymethods]
-impl PyPlcValue {
-    #[new]
-    fn new(value: Py<PyAny>) -> PyResult<Self> {
-        Python::attach(|py| {
-            let bound_value = value.bind(py);
-            if let Ok(val) = bound_value.extract::<bool>() {
-                Ok(PyPlcValue {
-                    value: PlcValue::Bool(val),
-                })
-            } else if let Ok(val) = bound_value.extract::<i32>() {
-                Ok(PyPlcValue {
-                    value: PlcValue::Dint(val),
-                })
-            } else if let Ok(val) = bound_value.extract::<f32>() {
-                Ok(PyPlcValue {
-                    value: PlcValue::Real(val),
-                })
-            } else if let Ok(val) = bound_value.extract::<f64>() {
-                Ok(PyPlcValue {
-                    value: PlcValue::Real(val as f32),
-                })
-            } else if let Ok(val) = bound_value.extract::<String>() {
-                Ok(PyPlcValue {
-                    value: PlcValue::String(val),
-                })
-            } else {
-                Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                    "Unsupported value type",
-                ))
-            }
-        })
-    }
+    // Typed factories. Each builds its PlcValue variant directly, with no
+    // dispatch on the Python type of the argument.
 
+    #[staticmethod]
+    fn bool_(val: bool) -> Self {
+        PyPlcValue {
+            value: PlcValue::Bool(val),
+        }
+    }
+    #[staticmethod]
+    fn sint(val: i8) -> Self {
+        PyPlcValue {
+            value: PlcValue::Sint(val),
+        }
+    }
+    #[staticmethod]
+    fn int_(val: i16) -> Self {
+        PyPlcValue {
+            value: PlcValue::Int(val),
+        }
+    }
     #[staticmethod]
     fn real(val: f32) -> Self {
         PyPlcValue {
@@ -284,10 +745,8 @@ impl PyPlcValue {
         }
     }
     #[staticmethod]
-    fn dint(val: i32) -> Self {
-        PyPlcValue {
-            value: PlcValue::Dint(val),
-        }
+    fn dint(py: Python<'_>, val: i32) -> PyResult<Py<Self>> {
+        plc_value_into_py(py, PlcValue::Dint(val))
     }
     #[staticmethod]
     fn lint(val: i64) -> Self {
@@ -304,28 +763,7 @@ impl PyPlcValue {
 
     #[getter]
     fn value(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        match &self.value {
-            PlcValue::Bool(b) => Ok(b.into_bound_py_any(py)?.unbind()),
-            PlcValue::Sint(i) => Ok(i.into_bound_py_any(py)?.unbind()),
-            PlcValue::Int(i) => Ok(i.into_bound_py_any(py)?.unbind()),
-            PlcValue::Dint(i) => Ok(i.into_bound_py_any(py)?.unbind()),
-            PlcValue::Lint(i) => Ok(i.into_bound_py_any(py)?.unbind()),
-            PlcValue::Usint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
-            PlcValue::Uint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
-            PlcValue::Udint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
-            PlcValue::Ulint(u) => Ok(u.into_bound_py_any(py)?.unbind()),
-            PlcValue::Real(f) => Ok(f.into_bound_py_any(py)?.unbind()),
-            PlcValue::Lreal(f) => Ok(f.into_bound_py_any(py)?.unbind()),
-            PlcValue::String(s) => Ok(s.into_bound_py_any(py)?.unbind()),
-            PlcValue::Udt(map) => {
-                let dict = PyDict::new(py);
-                for (k, v) in map.iter() {
-                    let v_py = PyPlcValue { value: v.clone() }.value(py)?;
-                    dict.set_item(k, v_py)?;
-                }
-                Ok(dict.unbind().into())
-            }
-        }
+        plc_value_to_native(py, &self.value)
     }
 
     fn __str__(&self) -> String {
@@ -337,6 +775,253 @@ impl PyPlcValue {
     }
 }
 
+/// Typed element storage for `PyPlcArray`
+enum ArrayData {
+    Bool(Vec<bool>),
+    Sint(Vec<i8>),
+    Int(Vec<i16>),
+    Dint(Vec<i32>),
+    Lint(Vec<i64>),
+    Usint(Vec<u8>),
+    Uint(Vec<u16>),
+    Udint(Vec<u32>),
+    Ulint(Vec<u64>),
+    Real(Vec<f32>),
+    Lreal(Vec<f64>),
+}
+
+fn raw_parts_of<T>(v: &[T], format: &'static [u8]) -> (*const u8, usize, usize, &'static [u8]) {
+    (
+        v.as_ptr() as *const u8,
+        v.len(),
+        std::mem::size_of::<T>(),
+        format,
+    )
+}
+
+impl ArrayData {
+    /// Pointer to the first element, element count, element size and
+    /// NUL-terminated struct-module format code
+    fn raw_parts(&self) -> (*const u8, usize, usize, &'static [u8]) {
+        match self {
+            ArrayData::Bool(v) => raw_parts_of(v, b"?\0"),
+            ArrayData::Sint(v) => raw_parts_of(v, b"b\0"),
+            ArrayData::Int(v) => raw_parts_of(v, b"h\0"),
+            ArrayData::Dint(v) => raw_parts_of(v, b"i\0"),
+            ArrayData::Lint(v) => raw_parts_of(v, b"q\0"),
+            ArrayData::Usint(v) => raw_parts_of(v, b"B\0"),
+            ArrayData::Uint(v) => raw_parts_of(v, b"H\0"),
+            ArrayData::Udint(v) => raw_parts_of(v, b"I\0"),
+            ArrayData::Ulint(v) => raw_parts_of(v, b"Q\0"),
+            ArrayData::Real(v) => raw_parts_of(v, b"f\0"),
+            ArrayData::Lreal(v) => raw_parts_of(v, b"d\0"),
+        }
+    }
+}
+
+/// Numeric or BOOL array read from the PLC, exposed through the buffer protocol
+///
+/// Elements are stored in a contiguous Rust `Vec`, so `memoryview(arr)` or
+/// `numpy.frombuffer(arr, dtype=arr.format)` view them without creating a
+/// Python object per element.
+#[pyclass(frozen)]
+struct PyPlcArray {
+    data: ArrayData,
+    // Buffer shape and strides, kept here so the pointers handed out in
+    // Py_buffer stay valid for as long as this object is alive
+    shape: [isize; 1],
+    strides: [isize; 1],
+}
+
+impl PyPlcArray {
+    fn from_data(data: ArrayData) -> Self {
+        let (_, len, itemsize, _) = data.raw_parts();
+        PyPlcArray {
+            data,
+            shape: [len as isize],
+            strides: [itemsize as isize],
+        }
+    }
+
+    /// Decode the first `count` elements of a Read Tag reply's data
+    ///
+    /// `data` holds little-endian elements of CIP type `data_type`; BOOL
+    /// arrays arrive as 0x00D3, 32-bit words of packed bits.
+    fn from_cip(data_type: u16, data: &[u8], count: usize) -> PyResult<Self> {
+        macro_rules! decode {
+            ($variant:ident, $t:ty) => {{
+                const SIZE: usize = std::mem::size_of::<$t>();
+                if data.len() < count * SIZE {
+                    return Err(short_array_reply(data.len(), count));
+                }
+                ArrayData::$variant(
+                    data.chunks_exact(SIZE)
+                        .take(count)
+                        .map(|b| <$t>::from_le_bytes(b.try_into().unwrap()))
+                        .collect(),
+                )
+            }};
+        }
+        let data = match data_type {
+            0x00C1 => {
+                if data.len() < count {
+                    return Err(short_array_reply(data.len(), count));
+                }
+                ArrayData::Bool(data[..count].iter().map(|&b| b != 0).collect())
+            }
+            0x00D3 => {
+                if data.len() * 8 < count {
+                    return Err(short_array_reply(data.len(), count));
+                }
+                ArrayData::Bool(
+                    (0..count)
+                        .map(|i| data[i / 8] & (1 << (i % 8)) != 0)
+                        .collect(),
+                )
+            }
+            0x00C2 => decode!(Sint, i8),
+            0x00C3 => decode!(Int, i16),
+            0x00C4 => decode!(Dint, i32),
+            0x00C5 => decode!(Lint, i64),
+            0x00C6 => decode!(Usint, u8),
+            0x00C7 => decode!(Uint, u16),
+            0x00C8 => decode!(Udint, u32),
+            0x00C9 => decode!(Ulint, u64),
+            0x00CA => decode!(Real, f32),
+            0x00CB => decode!(Lreal, f64),
+            other => {
+                return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                    "Only numeric and BOOL arrays can be exposed as buffers, got CIP type 0x{:04X}",
+                    other
+                )))
+            }
+        };
+        Ok(Self::from_data(data))
+    }
+
+    fn from_plc_values(values: Vec<PlcValue>) -> PyResult<Self> {
+        macro_rules! collect {
+            ($variant:ident) => {{
+                let mut out = Vec::with_capacity(values.len());
+                for value in values {
+                    match value {
+                        PlcValue::$variant(x) => out.push(x),
+                        other => {
+                            return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                                "Array elements have mixed types: expected {}, got {:?}",
+                                stringify!($variant),
+                                other
+                            )))
+                        }
+                    }
+                }
+                ArrayData::$variant(out)
+            }};
+        }
+        let data = match values.first().cloned() {
+            None => ArrayData::Dint(Vec::new()),
+            Some(PlcValue::Bool(_)) => collect!(Bool),
+            Some(PlcValue::Sint(_)) => collect!(Sint),
+            Some(PlcValue::Int(_)) => collect!(Int),
+            Some(PlcValue::Dint(_)) => collect!(Dint),
+            Some(PlcValue::Lint(_)) => collect!(Lint),
+            Some(PlcValue::Usint(_)) => collect!(Usint),
+            Some(PlcValue::Uint(_)) => collect!(Uint),
+            Some(PlcValue::Udint(_)) => collect!(Udint),
+            Some(PlcValue::Ulint(_)) => collect!(Ulint),
+            Some(PlcValue::Real(_)) => collect!(Real),
+            Some(PlcValue::Lreal(_)) => collect!(Lreal),
+            Some(other) => {
+                return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                    "Only numeric and BOOL arrays can be exposed as buffers, got {:?}",
+                    other
+                )))
+            }
+        };
+        Ok(Self::from_data(data))
+    }
+}
+
+fn short_array_reply(len: usize, count: usize) -> PyErr {
+    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+        "Array read returned {} bytes, too few for {} elements",
+        len, count
+    ))
+}
+
+#[pymethods]
+impl PyPlcArray {
+    /// Build an array from `PyPlcValue`s that all have the same numeric or BOOL type
+    #[staticmethod]
+    fn from_values(values: Vec<PyPlcValue>) -> PyResult<Self> {
+        Self::from_plc_values(values.into_iter().map(|v| v.value).collect())
+    }
+
+    /// struct-module format code of the elements, usable as a numpy dtype
+    #[getter]
+    fn format(&self) -> &'static str {
+        let (_, _, _, format) = self.data.raw_parts();
+        std::str::from_utf8(&format[..format.len() - 1]).unwrap()
+    }
+
+    fn __len__(&self) -> usize {
+        self.shape[0] as usize
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "PyPlcArray(format='{}', len={})",
+            self.format(),
+            self.shape[0]
+        )
+    }
+
+    /// Export the elements as a read-only, one-dimensional buffer
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut pyo3::ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(pyo3::exceptions::PyBufferError::new_err("View is null"));
+        }
+        if (flags & pyo3::ffi::PyBUF_WRITABLE) == pyo3::ffi::PyBUF_WRITABLE {
+            return Err(pyo3::exceptions::PyBufferError::new_err(
+                "PyPlcArray is read-only",
+            ));
+        }
+
+        let this = slf.get();
+        let (buf, len, itemsize, format) = this.data.raw_parts();
+
+        (*view).obj = slf.clone().into_any().into_ptr();
+        (*view).buf = buf as *mut c_void;
+        (*view).len = (len * itemsize) as isize;
+        (*view).readonly = 1;
+        (*view).itemsize = itemsize as isize;
+        (*view).format = if (flags & pyo3::ffi::PyBUF_FORMAT) == pyo3::ffi::PyBUF_FORMAT {
+            format.as_ptr() as *mut c_char
+        } else {
+            ptr::null_mut()
+        };
+        (*view).ndim = 1;
+        (*view).shape = if (flags & pyo3::ffi::PyBUF_ND) == pyo3::ffi::PyBUF_ND {
+            this.shape.as_ptr() as *mut isize
+        } else {
+            ptr::null_mut()
+        };
+        (*view).strides = if (flags & pyo3::ffi::PyBUF_STRIDES) == pyo3::ffi::PyBUF_STRIDES {
+            this.strides.as_ptr() as *mut isize
+        } else {
+            ptr::null_mut()
+        };
+        (*view).suboffsets = ptr::null_mut();
+        (*view).internal = ptr::null_mut();
+
+        Ok(())
+    }
+}
+
 /// Python wrapper for SubscriptionOptions
 #[pyclass]
 struct PySubscriptionOptions {